@@ -211,7 +211,7 @@ class CLIArgs:
             print(f"'client_id' file created with ID: {client_id}")
 
         else:
-            client_id = read_file_2string(filepath=client_id_file, mode="r")
+            client_id = read_file_2string(filepath=client_id_file)
 
         if not client_id:
             print("Error: 'client_id' not found. Exiting...")
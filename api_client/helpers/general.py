@@ -10,8 +10,11 @@ Functions:
     - calculate_file_hash: Computes the SHA-256 hash of a file.
     - read_file_2string: Reads the content of a file into a string.
     - write_string_2file: Writes a string to a file.
+    - BufferedStringWriter: Context manager that batches many small string writes into few.
     - write_batch_file: Writes batch metadata to a JSON file.
     - read_batch_file: Reads a batch file and returns its contents as a dictionary.
+    - read_batch_files: Reads several batch files, overlapping their file I/O.
+    - read_batch_file_stream: Yields the records of a JSON or JSON Lines batch file one at a time.
 
 Usage:
     Import the required function from this module to perform file operations or hash calculations.
@@ -30,14 +33,103 @@ Usage:
 Dependencies:
     - Python 3.12 or higher
     - `rich` library for enhanced console output
+    - `pysimdjson` or `ujson` (both optional) for faster batch file decoding; the fastest
+      installed one is picked at import time, falling back to the standard `json` module
+    - `pysimdjson` (optional) is also used for decoding large batch files
 """
 
+import functools
 import hashlib
 import json
+import mmap
 import os.path
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from rich import print
 
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Batch files larger than this are parsed with simdjson when it is installed
+SIMDJSON_MIN_BYTES = 64 * 1024
+# simdjson parsers are reusable, so keep one for the life of the process
+_simdjson_parser = simdjson.Parser() if simdjson else None
+
+
+def _simdjson_loads(buffer):
+    """
+    Decodes JSON with the shared simdjson parser into plain Python objects.
+
+    simdjson raises `RuntimeError` for valid documents it cannot represent, such as integers
+    wider than 64 bits; those are decoded with the standard `json` module instead.
+
+    Args:
+        buffer (bytes or memoryview): The raw JSON document.
+
+    Returns:
+        dict or list: The decoded JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid, matching the other backends.
+    """
+    try:
+        return _simdjson_parser.parse(buffer, recursive=True)
+    except ValueError as err:
+        raise json.JSONDecodeError(str(err), "", 0) from err
+    except RuntimeError:
+        return json.loads(bytes(buffer))
+
+
+def _select_json_loads():
+    """
+    Picks the fastest installed JSON decoder. Called once at import time.
+
+    The preference order is pysimdjson, ujson, then the standard `json` module. orjson is
+    not used: it turns integers wider than 64 bits into floats without raising, so the
+    fallback in `_decode_batch_json` could not catch the lost precision.
+
+    Returns:
+        tuple: The backend name, its `loads` callable, and whether it accepts buffers such
+            as `memoryview` (required for memory-mapped reads).
+    """
+    if _simdjson_parser is not None:
+        return "simdjson", _simdjson_loads, True
+
+    try:
+        import ujson
+
+        return "ujson", ujson.loads, False
+    except ImportError:
+        pass
+
+    return "json", json.loads, False
+
+
+JSON_BACKEND, json_loads, JSON_LOADS_ACCEPTS_BUFFERS = _select_json_loads()
+
+# Batch files larger than this are memory-mapped rather than read into a bytes copy,
+# provided the parser that handles them accepts buffers
+MMAP_MIN_BYTES = 1 << 20
+_can_mmap = _simdjson_parser is not None or JSON_LOADS_ACCEPTS_BUFFERS
+
+# Strings longer than this are encoded once and written straight to a raw file descriptor,
+# bypassing the TextIOWrapper and BufferedWriter layers of open()
+LARGE_WRITE_MIN_CHARS = 64 * 1024
+# Larger strings are encoded and written in slices of this many characters, bounding the
+# size of the temporary encoded copy
+LARGE_WRITE_CHUNK_CHARS = 1 << 20
+_LARGE_WRITE_FLAGS = {
+    "w": os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    "a": os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+}
+
+# Default thread count of read_batch_files; enough to overlap file reads, which is the
+# only part that runs in parallel
+READ_BATCH_FILES_MAX_WORKERS = 4
+
 
 def gen_batch_file_path(client_id, batch_id):
     """
@@ -73,23 +165,30 @@ def calculate_file_hash(file_path):
     return sha256_hash.hexdigest()
 
 
-def read_file_2string(filepath, mode="r"):
+def read_file_2string(filepath):
     """
     Reads the content of a file into a string.
 
+    The file is read as bytes and decoded as UTF-8, bypassing the text-mode decoding layer.
+    CRLF and CR line endings are normalized to LF, as text mode's universal newlines would.
+
     Args:
         filepath (str): The path to the file to read.
-        mode (str, optional): The mode in which to open the file. Defaults to "r".
 
     Returns:
-        str or None: The content of the file as a string, or None if the file does not exist.
+        str or None: The content of the file with leading and trailing whitespace removed,
+            or None if the file does not exist.
     """
     if not os.path.isfile(filepath):
         print(f"File not found: {filepath}")
         return None
 
-    with open(filepath, mode, encoding="utf-8") as infile:
-        filetext = infile.read().strip()
+    with open(filepath, "rb") as infile:
+        data = infile.read()
+    # Match text mode's universal newlines: CRLF and a lone CR both become LF
+    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    # Strip after decoding so Unicode whitespace such as NBSP is removed too
+    filetext = data.decode("utf-8").strip()
     return filetext
 
 
@@ -97,6 +196,10 @@ def write_string_2file(filepath, filetext, mode="w"):
     """
     Writes a string to a file.
 
+    Strings longer than `LARGE_WRITE_MIN_CHARS` written with mode "w" or "a" are encoded to
+    UTF-8 and written with `os.write` on a raw file descriptor, in slices of
+    `LARGE_WRITE_CHUNK_CHARS` characters.
+
     Args:
         filepath (str): The path to the file to write.
         filetext (str): The content to write to the file.
@@ -105,45 +208,321 @@ def write_string_2file(filepath, filetext, mode="w"):
     Returns:
         None
     """
+    flags = _LARGE_WRITE_FLAGS.get(mode)
+    if flags is not None and len(filetext) > LARGE_WRITE_MIN_CHARS:
+        # Newlines are written as-is, without text-mode translation
+        fd = os.open(filepath, flags, 0o666)
+        try:
+            print(f"Writing file: {filepath}")
+            # Encode a slice at a time so only one chunk's bytes are held alongside the str
+            for start in range(0, len(filetext), LARGE_WRITE_CHUNK_CHARS):
+                chunk = filetext[start : start + LARGE_WRITE_CHUNK_CHARS]
+                view = memoryview(chunk.encode("utf-8"))
+                while view:
+                    view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        return
+
     with open(filepath, mode, encoding="utf-8") as outfile:
         print(f"Writing file: {filepath}")
         outfile.write(filetext)
 
 
-def write_batch_file(filepath, batch_records):
+class BufferedStringWriter:
+    """
+    Context manager that batches many small string writes to one file.
+
+    The file is opened once on entry. Strings passed to `write` are collected in a list and
+    joined into a single `write` call whenever `flush_size` characters have accumulated, and
+    once more on exit. Use it instead of calling `write_string_2file` with `mode="a"` in a
+    loop, which opens and closes the file for every string.
+
+    Example:
+        with BufferedStringWriter("logs/run.log") as writer:
+            for line in lines:
+                writer.write(line)
+    """
+
+    def __init__(self, filepath, mode="a", flush_size=64 * 1024):
+        """
+        Initializes the BufferedStringWriter.
+
+        Args:
+            filepath (str): The path to the file to write.
+            mode (str, optional): The mode in which to open the file. Defaults to "a".
+            flush_size (int, optional): The number of buffered characters that triggers a
+                write to the file. Defaults to 64 KiB.
+        """
+        self.filepath = filepath
+        self.mode = mode
+        self.flush_size = flush_size
+        self._buffer = []
+        self._buffered = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.filepath, self.mode, buffering=65536, encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    def write(self, filetext):
+        """
+        Buffers a string, writing the buffer to the file once it reaches `flush_size`.
+
+        Args:
+            filetext (str): The content to write to the file.
+        """
+        self._buffer.append(filetext)
+        self._buffered += len(filetext)
+        if self._buffered >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered strings to the file in one call.
+        """
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+
+def write_batch_file(filepath, batch_records, indent=4):
     """
     Writes batch metadata to a JSON file.
 
     Args:
         filepath (str): The path to the file to write.
         batch_records (list): A list of batch records to write to the file.
+        indent (int, optional): The JSON indentation level. Use None for compact output,
+            which is smaller and faster to write. Defaults to 4.
 
     Returns:
         None
     """
     with open(filepath, "w", encoding="utf-8") as log_file:
-        json.dump(batch_records, log_file, indent=4)
+        json.dump(batch_records, log_file, indent=indent)
 
 
-def read_batch_file(batch_file_path):
+def _decode_batch_json(buffer):
+    """
+    Decodes batch file JSON, using simdjson for large inputs when it is installed.
+
+    The fast decoders reject some documents the standard `json` module accepts, such as the
+    `NaN` and `Infinity` values `write_batch_file` can write. When a fast decoder fails, the
+    document is decoded again with the standard `json` module, which raises if it really is
+    invalid.
+
+    Args:
+        buffer (bytes or memoryview): The raw batch file contents.
+
+    Returns:
+        dict or list: The decoded JSON document.
+    """
+    try:
+        if _simdjson_parser is not None and len(buffer) > SIMDJSON_MIN_BYTES:
+            return _simdjson_loads(buffer)
+        return json_loads(buffer)
+    except ValueError:
+        if json_loads is json.loads and _simdjson_parser is None:
+            raise
+        return json.loads(bytes(buffer))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_batch_file(batch_file_path, mtime_ns, size):
+    """
+    Reads and decodes a batch file, memoised on its absolute path, mtime and size.
+
+    Args:
+        batch_file_path (str): The absolute path to the batch file to read.
+        mtime_ns (int): The file modification time in nanoseconds (part of the cache key).
+        size (int): The file size in bytes (part of the cache key).
+
+    Returns:
+        dict or list: The decoded JSON document.
+    """
+    # Unbuffered: the file is read or mapped whole, so a BufferedReader adds nothing
+    with open(batch_file_path, "rb", buffering=0) as file:
+        if _can_mmap and size > MMAP_MIN_BYTES:
+            with mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped, memoryview(mapped) as view:
+                return _decode_batch_json(view)
+        raw = file.read()
+    return _decode_batch_json(raw)
+
+
+def _copy_json(value):
+    """
+    Copies a decoded JSON document, so callers can mutate it without touching the cache.
+
+    Only dicts and lists are copied; every other JSON value is immutable. This is much
+    faster than `copy.deepcopy`, which has to handle arbitrary objects.
+
+    Args:
+        value: The decoded JSON value.
+
+    Returns:
+        The copied value.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _readonly_view(value):
+    """
+    Builds a deeply read-only copy of a decoded JSON document.
+
+    Every dict, at any depth, becomes a `MappingProxyType` over a new dict, and every list
+    becomes a tuple, so nothing reachable from the result is the cached object itself.
+
+    Args:
+        value: The decoded JSON document.
+
+    Returns:
+        The read-only value: a `MappingProxyType` for a dict, a tuple for a list, or the
+        value itself for immutable JSON values.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: _readonly_view(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_readonly_view(item) for item in value)
+    return value
+
+
+def read_batch_file(batch_file_path, readonly=False):
     """
     Reads a batch file and returns its contents as a dictionary.
 
+    Decoded files are cached on (absolute path, mtime, size), so re-reading an unchanged
+    batch file skips parsing. Each call returns its own copy of the cached document, so
+    callers may mutate the result; call `read_batch_file.cache_clear()` to drop the cache.
+
     Args:
-        batch_file_path (str): The path to the batch file to read.
+        batch_file_path (str or os.PathLike): The path to the batch file to read.
+        readonly (bool, optional): If True, the contents are returned read-only at every
+            depth: dicts become `MappingProxyType` objects and lists (including the usual
+            top-level list of records) become tuples. Use this when the result is only
+            read. Defaults to False.
 
     Returns:
-        dict: The contents of the batch file.
+        dict, list, MappingProxyType or tuple: The contents of the batch file.
+
+    Raises:
+        FileNotFoundError: If the batch file does not exist.
+        ValueError: If the batch file contains invalid JSON.
+    """
+    batch_file_path = os.fspath(batch_file_path)
+    try:
+        stat = os.stat(batch_file_path)
+        data = _load_batch_file(
+            os.path.abspath(batch_file_path), stat.st_mtime_ns, stat.st_size
+        )
+        if readonly:
+            return _readonly_view(data)
+        return _copy_json(data)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Batch file not found: {batch_file_path}") from None
+    except ValueError as err:
+        # Every decoder backend raises a ValueError subclass
+        raise ValueError(f"Error decoding JSON from batch file: {err}") from err
+
+
+read_batch_file.cache_clear = _load_batch_file.cache_clear
+
+
+def read_batch_files(batch_file_paths, max_workers=None):
+    """
+    Reads several batch files concurrently and returns their contents in order.
+
+    Files are read with `read_batch_file` on a small thread pool. Only the file I/O
+    overlaps: JSON decoding holds the GIL with every backend, so it still runs one file
+    at a time, and more threads than `READ_BATCH_FILES_MAX_WORKERS` bring no benefit.
+
+    Args:
+        batch_file_paths (iterable): The paths (str or os.PathLike) of the batch files to read.
+        max_workers (int, optional): The maximum number of threads. Defaults to
+            `READ_BATCH_FILES_MAX_WORKERS`.
+
+    Returns:
+        list: The contents of each batch file, in the same order as `batch_file_paths`.
+
+    Raises:
+        FileNotFoundError: If any batch file does not exist.
+        ValueError: If any batch file contains invalid JSON.
+    """
+    batch_file_paths = list(batch_file_paths)
+    if len(batch_file_paths) < 2:
+        return [read_batch_file(path) for path in batch_file_paths]
+
+    if max_workers is None:
+        max_workers = READ_BATCH_FILES_MAX_WORKERS
+    max_workers = min(max_workers, len(batch_file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_batch_file, batch_file_paths))
+
+
+def read_batch_file_stream(batch_file_path):
+    """
+    Yields the records of a batch file one at a time.
+
+    The first non-whitespace byte decides how the file is read. A JSON array (`[`) is parsed
+    whole and its items are yielded. Otherwise the file is treated as JSON Lines and each
+    non-blank line is parsed on its own, so memory use stays constant and the first record
+    is available before the rest of the file is read. A file holding one pretty-printed
+    object is yielded as a single record.
+
+    Args:
+        batch_file_path (str or os.PathLike): The path to the batch file to read.
+
+    Yields:
+        dict: Each record in the batch file.
 
     Raises:
         FileNotFoundError: If the batch file does not exist.
         ValueError: If the batch file contains invalid JSON.
     """
     try:
-        with open(batch_file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
-        return data
+        with open(batch_file_path, "rb", buffering=65536) as file:
+            # Skip leading whitespace without reading past the first record
+            while True:
+                buffered = file.peek(1)
+                if not buffered:
+                    return
+                head = buffered.lstrip()
+                file.read(len(buffered) - len(head))
+                if head:
+                    break
+
+            if head[:1] == b"[":
+                yield from json_loads(file.read())
+                return
+
+            first_line = file.readline()
+            try:
+                record = json_loads(first_line)
+            except ValueError:
+                # Not a complete document on one line, so this is a single JSON object
+                yield json_loads(first_line + file.read())
+                return
+            yield record
+
+            for line in file:
+                if line.strip():
+                    yield json_loads(line)
     except FileNotFoundError:
-        raise FileNotFoundError(f"Batch file not found: {batch_file_path}")
-    except json.JSONDecodeError as err:
+        raise FileNotFoundError(f"Batch file not found: {batch_file_path}") from None
+    except ValueError as err:
         raise ValueError(f"Error decoding JSON from batch file: {err}") from err
@@ -42,6 +42,16 @@ def get_rek_iscat_color(rek_iscat):
 
     Returns:
         str: The color name ("green", "red", or "yellow") based on the `rek_iscat` value.
+
+    Example:
+        >>> get_rek_iscat_color("true")
+        'green'
+        >>> get_rek_iscat_color("FALSE")
+        'red'
+        >>> get_rek_iscat_color("N/A")
+        'red'
+        >>> get_rek_iscat_color("unknown")
+        'yellow'
     """
     if rek_iscat == "N/A":
         return "red"
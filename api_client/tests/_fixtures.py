@@ -0,0 +1,27 @@
+"""
+Module: _fixtures
+
+This module holds string constants shared across the api_client test modules. Each value
+is interned with `sys.intern` so every test module and `conftest.py` reuses the same
+string object instead of building a fresh literal.
+
+Dependencies:
+- sys: For interning the shared string constants.
+
+Constants:
+- `ROOT`: The current working directory pinned by the `fixed_cwd` fixture.
+- `FAKE_CWD`: The current working directory pinned by the `fake_cwd` fixture.
+- `CLIENT_ID`: A sample client id.
+- `BATCH_ID`: A sample batch id.
+- `CONFIG_DIR`: The config folder under `ROOT`.
+- `LOGS_DIR`: The logs folder under `FAKE_CWD`.
+"""
+
+import sys
+
+ROOT = sys.intern("/root")
+FAKE_CWD = sys.intern("/fake/cwd")
+CLIENT_ID = sys.intern("client123")
+BATCH_ID = sys.intern("batch456")
+CONFIG_DIR = sys.intern("/root/config")
+LOGS_DIR = sys.intern("/fake/cwd/logs")
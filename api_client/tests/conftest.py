@@ -2,40 +2,225 @@
 Module: conftest
 
 This module provides shared configurations and setup logic for pytest test cases in the project.
-It modifies the Python path to include the project root and relevant directories, enabling test
-modules to import project-specific modules without modifying their paths.
+The project root, the api_client directory and the `shared_helpers` directories are put on
+`sys.path` once per session by the `pythonpath` setting in `pytest.ini`, so test modules can
+import project-specific modules without modifying their paths.
 
 The configurations in this module ensure that:
-- The project root directory is added to `sys.path` for easy imports of project modules.
-- The `shared_helpers` directory is added to `sys.path` for importing helper modules.
-- Nested `shared_helpers` directories are also included in `sys.path` for deeper imports.
+- Tests that patch or touch the file system are marked `filesystem`, so they can be
+  deselected with `pytest -m "not filesystem"` or skipped by setting `FAST=1`.
+- Tests marked `slow` are skipped unless pytest is run with `--runslow`.
 
 Dependencies:
 - pytest: For test execution and fixture management.
+- unittest.mock: For patching config collaborators and `os.environ`.
+- boto3 / moto: For an in-memory SSM backend used by `patched_config`.
 - os: For handling file and directory paths.
-- sys: For modifying the Python path.
 
-This module does not define any test cases or fixtures directly but provides the necessary
-setup for the test environment.
+Fixtures:
+- `fixed_cwd`: Pins `os.getcwd` to "/root".
+- `fake_cwd`: Pins `os.getcwd` to "/fake/cwd".
+- `isfile_true`: Patches `os.path.isfile` to report that every file exists.
+- `logs_ready`: Patches the file system so the "logs" directory already exists.
+- `patched_config`: Patches the collaborators of `load_environment_variables` once per test.
+- `clean_env`: Runs the test against an empty, test-scoped `os.environ`.
+- `large_batch_records`: A session-scoped 1,000-record batch with nested data.
 """
 
 import os
-import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+import boto3
+import pytest
+from moto import mock_aws
 
-# Add the project root directory to sys.path
-repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-sys.path.insert(0, repo_root)
+import api_client.helpers.config as _cfg
+from api_client.tests._fixtures import FAKE_CWD, ROOT
 
-# Add the shared_helpers directory to sys.path
-shared_helpers_path = os.path.abspath(os.path.join(repo_root, "shared_helpers"))
-sys.path.insert(0, shared_helpers_path)
+### constants
 
-
-shared_helpers_path2 = os.path.abspath(
-    os.path.join(shared_helpers_path, "shared_helpers")
+# Test modules whose SUT reads, writes or checks paths on the file system
+_FILESYSTEM_TEST_MODULES = frozenset(
+    {
+        "test_buffered_string_writer",
+        "test_construct_secrets_path",
+        "test_gen_batch_file_path",
+        "test_read_batch_file",
+        "test_read_batch_file_stream",
+        "test_read_batch_files",
+        "test_read_file2string",
+        "test_write_batch_file",
+        "test_write_string2file",
+    }
 )
-sys.path.insert(0, shared_helpers_path2)
 
-print("sys.path:", sys.path)
+
+### Hooks
+def pytest_addoption(parser):
+    """
+    Add the `--runslow` command line option.
+
+    Args:
+        parser: The pytest command line parser.
+    """
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Mark file system tests with `filesystem` and skip them when `FAST=1` is set, and skip
+    tests marked `slow` unless `--runslow` is given.
+
+    Args:
+        config: The pytest config object.
+        items: The collected test items.
+    """
+    skip_fast = (
+        pytest.mark.skip(reason="FAST=1 skips filesystem tests")
+        if os.getenv("FAST") == "1"
+        else None
+    )
+    skip_slow = (
+        None
+        if config.getoption("--runslow")
+        else pytest.mark.skip(reason="use --runslow to run slow tests")
+    )
+    for item in items:
+        if item.path.stem in _FILESYSTEM_TEST_MODULES:
+            item.add_marker(pytest.mark.filesystem)
+            if skip_fast:
+                item.add_marker(skip_fast)
+        if skip_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+### Fixtures
+@pytest.fixture
+def fixed_cwd(monkeypatch):
+    """
+    Pin the current working directory to "/root".
+
+    Args:
+        monkeypatch: The pytest fixture for patching attributes.
+
+    Returns:
+        str: The patched current working directory.
+    """
+    monkeypatch.setattr(os, "getcwd", lambda _r=ROOT: _r)
+    return ROOT
+
+
+@pytest.fixture
+def fake_cwd(monkeypatch):
+    """
+    Pin the current working directory to "/fake/cwd".
+
+    Args:
+        monkeypatch: The pytest fixture for patching attributes.
+
+    Returns:
+        str: The patched current working directory.
+    """
+    monkeypatch.setattr(os, "getcwd", lambda _r=FAKE_CWD: _r)
+    return FAKE_CWD
+
+
+@pytest.fixture
+def isfile_true(monkeypatch):
+    """
+    Patch `os.path.isfile` so that every path is reported as an existing file.
+
+    Args:
+        monkeypatch: The pytest fixture for patching attributes.
+    """
+    monkeypatch.setattr(os.path, "isfile", lambda _path: True)
+
+
+@pytest.fixture
+def logs_ready(monkeypatch):
+    """
+    Patch the file system so that the "logs" directory already exists.
+
+    `os.path.exists` always returns True and `os.makedirs` becomes a no-op.
+
+    Args:
+        monkeypatch: The pytest fixture for patching attributes.
+    """
+    monkeypatch.setattr(os.path, "exists", lambda _path: True)
+    monkeypatch.setattr(os, "makedirs", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def patched_config():
+    """
+    Patch the collaborators of `load_environment_variables` in `api_client.helpers.config`.
+
+    SSM is served by a moto in-memory backend: `ssm_client` is replaced with a moto-backed
+    client and `fetch_values_from_ssm` runs for real behind a spy (`wraps`), so tests seed
+    parameters with `put_parameter` rather than stubbing the helper. Tests adjust the
+    yielded mocks (`return_value`, `side_effect`, or the `ssm_keys` list in place) instead
+    of installing fresh patches of their own. By default the secrets path resolves to
+    "/path/to/.env" and `check_env_variables` passes.
+
+    Yields:
+        SimpleNamespace: The installed mocks, as `fetch`, `ssm_client`, `check`,
+        `ssm_keys`, `construct_path` and `load_dotenv`.
+    """
+    with mock_aws(config={"core": {"reset_boto3_session": False}}):
+        mocks = SimpleNamespace(
+            fetch=MagicMock(wraps=_cfg.fetch_values_from_ssm),
+            ssm_client=boto3.client("ssm", region_name="us-east-1"),
+            check=MagicMock(return_value=True),
+            ssm_keys=[],
+            construct_path=MagicMock(return_value="/path/to/.env"),
+            load_dotenv=MagicMock(),
+        )
+        with patch.multiple(
+            _cfg,
+            fetch_values_from_ssm=mocks.fetch,
+            ssm_client=mocks.ssm_client,
+            check_env_variables=mocks.check,
+            ssm_keys=mocks.ssm_keys,
+            construct_secrets_path=mocks.construct_path,
+            load_dotenv=mocks.load_dotenv,
+        ):
+            yield mocks
+
+
+@pytest.fixture
+def clean_env():
+    """
+    Clear `os.environ` for the duration of a test and restore it afterwards.
+
+    Writes made by the SUT (or by mocked loaders) stay scoped to the test instead of
+    leaking into the process environment seen by later tests.
+
+    Yields:
+        os._Environ: The emptied `os.environ` mapping.
+    """
+    with patch.dict(os.environ, {}, clear=True):
+        yield os.environ
+
+
+@pytest.fixture(scope="session")
+def large_batch_records():
+    """
+    A 1,000-record batch with nested data, built once per session.
+
+    The tuple itself is immutable; consumers pass `list(large_batch_records)` to the SUT and
+    must not mutate the shared record dicts.
+
+    Returns:
+        tuple: The batch records.
+    """
+    return tuple(
+        {
+            "id": i,
+            "data": "x" * 100,  # 100 character string
+            "nested": {"values": list(range(20))},
+        }
+        for i in range(1000)
+    )
@@ -0,0 +1,126 @@
+"""
+Module: test_buffered_string_writer
+
+This module contains unit tests for the `BufferedStringWriter` class in the
+`api_client.helpers.general` module. The `BufferedStringWriter` context manager is responsible
+for batching many small string writes into a few writes to one open file.
+
+The tests in this module ensure that:
+- Strings written below the flush size reach the file in a single write on exit.
+- The buffer is written to the file each time the flush size is reached.
+- Buffered content is written and the file closed even when the block raises.
+- Content is appended to an existing file by default.
+
+Dependencies:
+- pytest: For test execution and assertions.
+- unittest.mock: For patching `open` and checking the writes made to the file handle.
+- api_client.helpers.general.BufferedStringWriter: The class under test.
+
+Test Cases:
+- `test_buffered_writer_batches_writes`: Verifies that several small strings are written with a single `write` call.
+- `test_flushes_when_flush_size_reached`: Ensures the buffer is written each time `flush_size` characters accumulate.
+- `test_flushes_and_closes_on_exception`: Verifies that buffered content is written and the file closed when the block raises.
+- `test_appends_to_existing_content`: Ensures the writer appends to an existing file by default.
+"""
+
+from unittest.mock import call, mock_open, patch
+
+import pytest
+
+from api_client.helpers.general import BufferedStringWriter
+
+
+class TestBufferedStringWriter:
+    """
+    Test suite for the `BufferedStringWriter` class.
+    """
+
+    # Writes several small strings with a single write call
+    def test_buffered_writer_batches_writes(self):
+        """
+        Test that strings written below the flush size reach the file in one `write` call.
+
+        Asserts:
+            - The file is opened once in append mode.
+            - A single `write` call receives all the strings joined in order.
+        """
+        # Arrange
+        lines = [f"line {i}\n" for i in range(100)]
+
+        # Act
+        with patch("builtins.open", mock_open()) as mocked_open:
+            with BufferedStringWriter("test_buffered.txt") as writer:
+                for line in lines:
+                    writer.write(line)
+
+        # Assert
+        mocked_open.assert_called_once_with(
+            "test_buffered.txt", "a", buffering=65536, encoding="utf-8"
+        )
+        mocked_open().write.assert_called_once_with("".join(lines))
+
+    # Writes the buffer each time flush_size characters accumulate
+    def test_flushes_when_flush_size_reached(self):
+        """
+        Test that the buffer is written to the file each time `flush_size` characters
+        have accumulated, with the remainder written on exit.
+
+        Asserts:
+            - The writes are made in order at each threshold and on exit.
+        """
+        # Act
+        with patch("builtins.open", mock_open()) as mocked_open:
+            with BufferedStringWriter("test_buffered.txt", flush_size=10) as writer:
+                for _ in range(5):
+                    writer.write("abcde")
+
+        # Assert
+        assert mocked_open().write.call_args_list == [
+            call("abcdeabcde"),
+            call("abcdeabcde"),
+            call("abcde"),
+        ]
+
+    # Writes buffered content and closes the file when the block raises
+    def test_flushes_and_closes_on_exception(self):
+        """
+        Test that buffered content is written and the file closed when the `with` block raises.
+
+        Asserts:
+            - The exception propagates.
+            - The buffered string is written and the file is closed.
+        """
+        # Act & Assert
+        with patch("builtins.open", mock_open()) as mocked_open:
+            with pytest.raises(RuntimeError):
+                with BufferedStringWriter("test_buffered.txt") as writer:
+                    writer.write("partial")
+                    raise RuntimeError("boom")
+
+        mocked_open().write.assert_called_once_with("partial")
+        mocked_open().close.assert_called_once()
+
+    # Appends to an existing file by default
+    def test_appends_to_existing_content(self, tmp_path):
+        """
+        Test that the writer appends to an existing file by default.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The file contains the initial content followed by the buffered strings.
+        """
+        # Arrange
+        test_file = tmp_path / "test_append.txt"
+        test_file.write_text("Initial content\n", encoding="utf-8")
+
+        # Act
+        with BufferedStringWriter(str(test_file)) as writer:
+            writer.write("First line\n")
+            writer.write("Second line\n")
+
+        # Assert
+        assert test_file.read_text(encoding="utf-8") == (
+            "Initial content\nFirst line\nSecond line\n"
+        )
@@ -12,9 +12,10 @@ The tests in this module ensure that:
 - The function handles edge cases such as empty filenames and relative paths.
 
 Dependencies:
-- pytest: For test execution and assertions.
+- pytest: For test execution, assertions, and the `monkeypatch` fixture.
 - unittest.mock: For mocking file system operations and system calls.
 - api_client.helpers.config.construct_secrets_path: The function under test.
+- api_client.tests._fixtures: Shared interned path and id constants.
 
 Test Cases:
 - `test_returns_correct_path_when_file_exists`: Verifies that the function returns the correct path when the secrets file exists.
@@ -29,54 +30,59 @@ Test Cases:
 - `test_handles_paths_with_spaces`: Ensures the function handles paths with spaces correctly.
 """
 
+from unittest.mock import patch
+
+import pytest
+
 from api_client.helpers.config import construct_secrets_path
+from api_client.tests._fixtures import CONFIG_DIR
+
+_LONG_FILENAME = "a" * 200 + ".env"  # 200 'a's followed by .env
 
 
+@pytest.mark.usefixtures("fixed_cwd")
 class TestConstructSecretsPath:
     """
     Test suite for the `construct_secrets_path` function.
     """
 
     # Returns correct path when secrets file exists
-    def test_returns_correct_path_when_file_exists(self, mocker):
+    def test_returns_correct_path_when_file_exists(self, isfile_true):
         """
         Test that the function returns the correct path when the secrets file exists.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
 
         Asserts:
             - The returned path matches the expected path.
-            - The `os.path.isfile` method is called with the correct path.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mock_isfile = mocker.patch("os.path.isfile", return_value=True)
         secret_filename = ".env"
-        expected_path = "/root/config/.env"
+        expected_path = f"{CONFIG_DIR}/.env"
 
         # Act
         result = construct_secrets_path(secret_filename)
 
         # Assert
         assert result == expected_path
-        mock_isfile.assert_called_once_with(expected_path)
 
     # Constructs path using current working directory and config folder
-    def test_constructs_path_using_cwd_and_config_folder(self, mocker):
+    def test_constructs_path_using_cwd_and_config_folder(
+        self, isfile_true, monkeypatch
+    ):
         """
         Test that the function constructs the path using the current working directory and the config folder.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
+            monkeypatch: The pytest fixture for patching attributes.
 
         Asserts:
             - The returned path matches the expected path.
-            - The `os.getcwd` method is called once.
         """
         # Arrange
-        mock_getcwd = mocker.patch("os.getcwd", return_value="/custom/path")
-        mocker.patch("os.path.isfile", return_value=True)
+        monkeypatch.setattr("os.getcwd", lambda: "/custom/path")
         secret_filename = "secrets.env"
         expected_path = "/custom/path/config/secrets.env"
 
@@ -85,24 +91,21 @@ class TestConstructSecretsPath:
 
         # Assert
         assert result == expected_path
-        mock_getcwd.assert_called_once()
 
     # Properly formats the path with the provided filename
-    def test_formats_path_with_provided_filename(self, mocker):
+    def test_formats_path_with_provided_filename(self, isfile_true):
         """
         Test that the function properly formats the path with the provided filename.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
 
         Asserts:
             - The returned path includes the provided filename.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mocker.patch("os.path.isfile", return_value=True)
         secret_filename = "test_secrets.json"
-        expected_path = "/root/config/test_secrets.json"
+        expected_path = f"{CONFIG_DIR}/test_secrets.json"
 
         # Act
         result = construct_secrets_path(secret_filename)
@@ -112,19 +115,19 @@ class TestConstructSecretsPath:
         assert "test_secrets.json" in result
 
     # Handles relative paths correctly
-    def test_handles_relative_paths_correctly(self, mocker):
+    def test_handles_relative_paths_correctly(self, isfile_true, monkeypatch):
         """
         Test that the function handles relative paths correctly.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
+            monkeypatch: The pytest fixture for patching attributes.
 
         Asserts:
             - The returned path matches the expected relative path.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value=".")
-        mocker.patch("os.path.isfile", return_value=True)
+        monkeypatch.setattr("os.getcwd", lambda: ".")
         secret_filename = "secrets.env"
         expected_path = "./config/secrets.env"
 
@@ -135,19 +138,17 @@ class TestConstructSecretsPath:
         assert result == expected_path
 
     # Works with different filenames
-    def test_works_with_different_filenames(self, mocker):
+    def test_works_with_different_filenames(self, isfile_true):
         """
         Test that the function works with various filenames.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
 
         Asserts:
             - The returned path matches the expected path for each filename.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mocker.patch("os.path.isfile", return_value=True)
         filenames = [".env", "secrets.json", "config.yaml", "credentials.txt"]
 
         for filename in filenames:
@@ -155,51 +156,50 @@ class TestConstructSecretsPath:
             result = construct_secrets_path(filename)
 
             # Assert
-            assert result == f"/root/config/{filename}"
+            assert result == f"{CONFIG_DIR}/{filename}"
 
     # Exits with code 1 when secrets file does not exist
-    def test_exits_when_secrets_file_does_not_exist(self, mocker):
+    @patch("os.path.isfile", return_value=False)
+    def test_exits_when_secrets_file_does_not_exist(self, mock_isfile, capsys):
         """
         Test that the function exits with an error when the secrets file does not exist.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            mock_isfile: Mock for `os.path.isfile`, reporting that the file is missing.
+            capsys: The pytest fixture for capturing stdout and stderr.
 
         Asserts:
-            - The `print` method is called with the correct error message.
-            - The `sys.exit` method is called with exit code 1.
+            - Exactly the expected error message is printed to stdout.
+            - A `SystemExit` exception is raised with exit code 1.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mocker.patch("os.path.isfile", return_value=False)
-        mock_print = mocker.patch("api_client.helpers.config.print")
-        mock_exit = mocker.patch("sys.exit")
         secret_filename = ".env"
-        expected_path = "/root/config/.env"
+        expected_path = f"{CONFIG_DIR}/.env"
 
         # Act
-        construct_secrets_path(secret_filename)
+        with pytest.raises(SystemExit) as exc_info:
+            construct_secrets_path(secret_filename)
 
         # Assert
-        mock_print.assert_called_once_with(
-            f"No secret file found at dotenv_path: {expected_path}"
+        captured = capsys.readouterr()
+        assert (
+            captured.out.strip()
+            == f"No secret file found at dotenv_path: {expected_path}"
         )
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
 
     # Handles special characters in filename
-    def test_handles_special_characters_in_filename(self, mocker):
+    def test_handles_special_characters_in_filename(self, isfile_true):
         """
         Test that the function handles filenames with special characters.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
 
         Asserts:
             - The returned path matches the expected path for each special character filename.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mocker.patch("os.path.isfile", return_value=True)
         special_filenames = [
             "file-with-dashes.env",
             "file_with_underscores.env",
@@ -212,77 +212,75 @@ class TestConstructSecretsPath:
             result = construct_secrets_path(filename)
 
             # Assert
-            assert result == f"/root/config/{filename}"
+            assert result == f"{CONFIG_DIR}/{filename}"
 
     # Handles empty string as filename
-    def test_handles_empty_string_as_filename(self, mocker):
+    @patch("os.path.isfile", return_value=False)
+    def test_handles_empty_string_as_filename(self, mock_isfile, capsys):
         """
         Test that the function handles empty strings as filenames gracefully.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            mock_isfile: Mock for `os.path.isfile`, reporting that the file is missing.
+            capsys: The pytest fixture for capturing stdout and stderr.
 
         Asserts:
-            - The `print` method is called with the correct error message.
-            - The `sys.exit` method is called with exit code 1.
+            - Exactly the expected error message is printed to stdout.
+            - A `SystemExit` exception is raised with exit code 1.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mocker.patch("os.path.isfile", return_value=False)
-        mock_print = mocker.patch("api_client.helpers.config.print")
-        mock_exit = mocker.patch("sys.exit")
         secret_filename = ""
-        expected_path = "/root/config/"
+        expected_path = f"{CONFIG_DIR}/"
 
         # Act
-        construct_secrets_path(secret_filename)
+        with pytest.raises(SystemExit) as exc_info:
+            construct_secrets_path(secret_filename)
 
         # Assert
-        mock_print.assert_called_once_with(
-            f"No secret file found at dotenv_path: {expected_path}"
+        captured = capsys.readouterr()
+        assert (
+            captured.out.strip()
+            == f"No secret file found at dotenv_path: {expected_path}"
         )
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
 
     # Handles very long filenames
-    def test_handles_very_long_filenames(self, mocker):
+    def test_handles_very_long_filenames(self, isfile_true):
         """
         Test that the function handles very long filenames correctly.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
 
         Asserts:
             - The returned path matches the expected path for the long filename.
             - The length of the returned path is greater than 200 characters.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/root")
-        mocker.patch("os.path.isfile", return_value=True)
-        long_filename = "a" * 200 + ".env"  # 200 'a's followed by .env
-        expected_path = f"/root/config/{long_filename}"
+        expected_path = f"{CONFIG_DIR}/{_LONG_FILENAME}"
 
         # Act
-        result = construct_secrets_path(long_filename)
+        result = construct_secrets_path(_LONG_FILENAME)
 
         # Assert
         assert result == expected_path
         assert len(result) > 200  # Ensure the path is indeed long
 
     # Handles paths with spaces
-    def test_handles_paths_with_spaces(self, mocker):
+    def test_handles_paths_with_spaces(self, isfile_true, monkeypatch):
         """
         Test that the function handles paths with spaces correctly.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            isfile_true: Fixture patching `os.path.isfile` to report that the file exists.
+            monkeypatch: The pytest fixture for patching attributes.
 
         Asserts:
             - The returned path matches the expected path.
             - The returned path preserves spaces in the directory or filename.
         """
         # Arrange
-        mocker.patch("os.getcwd", return_value="/path with spaces")
-        mocker.patch("os.path.isfile", return_value=True)
+        monkeypatch.setattr("os.getcwd", lambda: "/path with spaces")
         filename_with_spaces = "secret file.env"
         expected_path = "/path with spaces/config/secret file.env"
 
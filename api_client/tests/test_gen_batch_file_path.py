@@ -17,6 +17,7 @@ Dependencies:
 - pytest: For test execution and assertions.
 - unittest.mock: For mocking file system operations and environment variables.
 - os: For handling file and directory paths.
+- api_client.tests._fixtures: Shared interned path and id constants.
 
 Test Cases:
 - `test_returns_correct_file_path_format`: Verifies that the function generates the correct file path format.
@@ -30,8 +31,14 @@ Test Cases:
 """
 
 import os
+from unittest.mock import patch
 
 from api_client.helpers.general import gen_batch_file_path
+from api_client.tests._fixtures import BATCH_ID, CLIENT_ID, LOGS_DIR
+
+_LONG_CLIENT = "client" + "x" * 1000
+_LONG_BATCH = "batch" + "y" * 1000
+_LONG_EXPECTED_PATH = f"{LOGS_DIR}/{_LONG_CLIENT}_{_LONG_BATCH}.json"
 
 
 class TestGenBatchFilePath:
@@ -40,141 +47,123 @@ class TestGenBatchFilePath:
     """
 
     # Returns correct file path with client_id and batch_id in the format "{client_id}_{batch_id}.json"
-    def test_returns_correct_file_path_format(self, mocker):
+    def test_returns_correct_file_path_format(self, fake_cwd, logs_ready):
         """
         Test that the function generates the correct file path format.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
+            logs_ready: Fixture patching the file system so the logs directory already exists.
 
         Asserts:
-            - The file name matches the format `{client_id}_{batch_id}.json`.
-            - The directory path matches the "logs" directory in the current working directory.
+            - The returned path is `{client_id}_{batch_id}.json` inside the "logs" directory of the current working directory.
         """
         # Arrange
-        client_id = "client123"
-        batch_id = "batch456"
-        expected_filename = f"{client_id}_{batch_id}.json"
-        mock_cwd = "/fake/cwd"
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mocker.patch("os.path.exists", return_value=True)
-        mocker.patch("os.makedirs")
+        client_id = CLIENT_ID
+        batch_id = BATCH_ID
 
         # Act
         result = gen_batch_file_path(client_id, batch_id)
 
         # Assert
-        assert os.path.basename(result) == expected_filename
-        assert os.path.dirname(result) == os.path.join(mock_cwd, "logs")
+        assert result == f"{LOGS_DIR}/{client_id}_{batch_id}.json"
 
     # Creates a "logs" directory in the current working directory if it doesn't exist
-    def test_creates_logs_directory_if_not_exists(self, mocker):
+    def test_creates_logs_directory_if_not_exists(self, fake_cwd):
         """
         Test that the function creates the "logs" directory in the current working directory if it does not exist.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
 
         Asserts:
-            - The `os.makedirs` method is called to create the "logs" directory.
+            - `os.path.exists` is checked once for the "logs" directory.
+            - The `os.makedirs` method is called once to create the "logs" directory.
         """
         # Arrange
-        client_id = "client123"
-        batch_id = "batch456"
-        mock_cwd = "/fake/cwd"
-        logs_path = os.path.join(mock_cwd, "logs")
-
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mock_exists = mocker.patch("os.path.exists", return_value=False)
-        mock_makedirs = mocker.patch("os.makedirs")
+        client_id = CLIENT_ID
+        batch_id = BATCH_ID
+        logs_path = LOGS_DIR
 
         # Act
-
-        gen_batch_file_path(client_id, batch_id)
+        with patch("os.path.exists", return_value=False) as mock_exists, patch(
+            "os.makedirs"
+        ) as mock_makedirs:
+            gen_batch_file_path(client_id, batch_id)
 
         # Assert
-        mock_exists.assert_called_once_with(logs_path)
-        mock_makedirs.assert_called_once_with(logs_path)
+        assert mock_exists.call_count == 1
+        assert mock_exists.call_args.args == (logs_path,)
+        assert mock_makedirs.call_count == 1
+        assert mock_makedirs.call_args.args == (logs_path,)
 
     # Handles valid string inputs for both client_id and batch_id
-    def test_handles_valid_string_inputs(self, mocker):
+    def test_handles_valid_string_inputs(self, fake_cwd, logs_ready):
         """
         Test that the function handles valid string inputs for `client_id` and `batch_id`.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
+            logs_ready: Fixture patching the file system so the logs directory already exists.
 
         Asserts:
-            - The file name matches the format `{client_id}_{batch_id}.json` for each test case.
+            - The returned path is `/fake/cwd/logs/{client_id}_{batch_id}.json` for each test case.
         """
         # Arrange
         test_cases = [
-            ("client123", "batch456"),
+            (CLIENT_ID, BATCH_ID),
             ("client-abc", "batch-xyz"),
             ("CLIENT_123", "BATCH_456"),
             ("123", "456"),
         ]
-        mocker.patch("os.getcwd", return_value="/fake/cwd")
-        mocker.patch("os.path.exists", return_value=True)
-        mocker.patch("os.makedirs")
 
         # Act & Assert
 
         for client_id, batch_id in test_cases:
             result = gen_batch_file_path(client_id, batch_id)
-            assert os.path.basename(result) == f"{client_id}_{batch_id}.json"
+            assert result == f"{LOGS_DIR}/{client_id}_{batch_id}.json"
 
     # Returns an absolute path that includes the current working directory
-    def test_returns_absolute_path_with_cwd(self, mocker):
+    def test_returns_absolute_path_with_cwd(self, fake_cwd, logs_ready):
         """
         Test that the function returns an absolute path that includes the current working directory.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
+            logs_ready: Fixture patching the file system so the logs directory already exists.
 
         Asserts:
             - The returned path starts with the current working directory.
             - The returned path is an absolute path.
         """
         # Arrange
-        client_id = "client123"
-        batch_id = "batch456"
-        mock_cwd = "/fake/cwd"
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mocker.patch("os.path.exists", return_value=True)
-        mocker.patch("os.makedirs")
+        client_id = CLIENT_ID
+        batch_id = BATCH_ID
 
         # Act
 
         result = gen_batch_file_path(client_id, batch_id)
 
         # Assert
-        assert result.startswith(mock_cwd)
+        assert result.startswith(fake_cwd)
         assert os.path.isabs(result)
 
     # Successfully joins path components using os.path.join
-    def test_joins_path_components_correctly(self, mocker):
+    def test_joins_path_components_correctly(self, fake_cwd, logs_ready):
         """
         Test that the function correctly joins path components using `os.path.join`.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
+            logs_ready: Fixture patching the file system so the logs directory already exists.
 
         Asserts:
-            - The returned path matches the expected path constructed using `os.path.join`.
+            - The returned path matches the expected "/fake/cwd/logs/{client_id}_{batch_id}.json" path.
         """
         # Arrange
-        client_id = "client123"
-        batch_id = "batch456"
-        mock_cwd = "/fake/cwd"
-        expected_logs_dir = os.path.join(mock_cwd, "logs")
-        expected_file_path = os.path.join(
-            expected_logs_dir, f"{client_id}_{batch_id}.json"
-        )
-
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mocker.patch("os.path.exists", return_value=True)
-        mocker.patch("os.makedirs")
+        client_id = CLIENT_ID
+        batch_id = BATCH_ID
+        expected_file_path = f"{LOGS_DIR}/{client_id}_{batch_id}.json"
 
         # Act
 
@@ -184,87 +173,73 @@ class TestGenBatchFilePath:
         assert result == expected_file_path
 
     # Handles empty strings for client_id or batch_id
-    def test_handles_empty_string_inputs(self, mocker):
+    def test_handles_empty_string_inputs(self, fake_cwd, logs_ready):
         """
         Test that the function handles empty strings for `client_id` or `batch_id`.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
+            logs_ready: Fixture patching the file system so the logs directory already exists.
 
         Asserts:
-            - The file name matches the format `{client_id}_{batch_id}.json` even when inputs are empty strings.
+            - The returned path is `/fake/cwd/logs/{client_id}_{batch_id}.json` even when inputs are empty strings.
         """
         # Arrange
-        test_cases = [("", "batch456"), ("client123", ""), ("", "")]
-        mock_cwd = "/fake/cwd"
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mocker.patch("os.path.exists", return_value=True)
-        mocker.patch("os.makedirs")
+        test_cases = [("", BATCH_ID), (CLIENT_ID, ""), ("", "")]
 
         # Act & Assert
 
         for client_id, batch_id in test_cases:
             result = gen_batch_file_path(client_id, batch_id)
-            assert os.path.basename(result) == f"{client_id}_{batch_id}.json"
-            assert os.path.dirname(result) == os.path.join(mock_cwd, "logs")
+            assert result == f"{LOGS_DIR}/{client_id}_{batch_id}.json"
 
     # Handles very long client_id or batch_id values
-    def test_handles_very_long_ids(self, mocker):
+    def test_handles_very_long_ids(self, fake_cwd, logs_ready):
         """
         Test that the function handles very long `client_id` or `batch_id` values.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
+            logs_ready: Fixture patching the file system so the logs directory already exists.
 
         Asserts:
-            - The file name matches the format `{client_id}_{batch_id}.json` for long inputs.
+            - The returned path is `/fake/cwd/logs/{client_id}_{batch_id}.json` for long inputs.
         """
         # Arrange
-        long_client_id = "client" + "x" * 1000
-        long_batch_id = "batch" + "y" * 1000
-        mock_cwd = "/fake/cwd"
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mocker.patch("os.path.exists", return_value=True)
-        mocker.patch("os.makedirs")
 
         # Act
 
-        result = gen_batch_file_path(long_client_id, long_batch_id)
+        result = gen_batch_file_path(_LONG_CLIENT, _LONG_BATCH)
 
         # Assert
-        assert os.path.basename(result) == f"{long_client_id}_{long_batch_id}.json"
-        assert os.path.dirname(result) == os.path.join(mock_cwd, "logs")
+        assert result == _LONG_EXPECTED_PATH
 
     # Behavior when logs directory exists but is not writable
-    def test_logs_directory_not_writable(self, mocker):
+    def test_logs_directory_not_writable(self, fake_cwd):
         """
         Test that the function behaves correctly when the "logs" directory exists but is not writable.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            fake_cwd: Fixture pinning the current working directory to "/fake/cwd".
 
         Asserts:
             - The function still returns the correct file path.
             - The `os.makedirs` method is not called if the directory exists.
         """
         # Arrange
-        client_id = "client123"
-        batch_id = "batch456"
-        mock_cwd = "/fake/cwd"
-        logs_path = os.path.join(mock_cwd, "logs")
-
-        mocker.patch("os.getcwd", return_value=mock_cwd)
-        mocker.patch("os.path.exists", return_value=True)  # Directory exists
-        mock_makedirs = mocker.patch(
-            "os.makedirs", side_effect=PermissionError("Permission denied")
-        )
+        client_id = CLIENT_ID
+        batch_id = BATCH_ID
 
         # Act & Assert
 
-        # The function should still return the path even if the directory can't be created
-        result = gen_batch_file_path(client_id, batch_id)
+        # The logs directory exists, and makedirs would raise if it were called
+        with patch("os.path.exists", return_value=True), patch(
+            "os.makedirs", side_effect=PermissionError("Permission denied")
+        ) as mock_makedirs:
+            # The function should still return the path even if the directory can't be created
+            result = gen_batch_file_path(client_id, batch_id)
 
         # The function should still return the correct path
-        assert result == os.path.join(logs_path, f"{client_id}_{batch_id}.json")
+        assert result == f"{LOGS_DIR}/{client_id}_{batch_id}.json"
         # makedirs should not be called since the directory exists
         mock_makedirs.assert_not_called()
@@ -15,102 +15,75 @@ Dependencies:
 - api_client.helpers.rich_printer.get_rek_iscat_color: The function under test.
 
 Test Cases:
-- `test_returns_green_for_true`: Verifies that the function returns "green" when the input is "true".
-- `test_returns_red_for_false`: Verifies that the function returns "red" when the input is "false".
-- `test_returns_red_for_na`: Verifies that the function returns "red" when the input is "N/A".
-- `test_case_insensitive_true`: Ensures the function handles case-insensitive comparison for "true".
-- `test_case_insensitive_false`: Ensures the function handles case-insensitive comparison for "false".
+- `test_color`: Verifies the returned color for "true", "TRUE", "false", "FALSE" and "N/A".
+- `test_color_case_insensitive`: Verifies every upper/lower-case variant of "true" and "false",
+  and the default color for unexpected values.
 """
 
+import itertools
+
+import pytest
+
 from api_client.helpers.rich_printer import get_rek_iscat_color
 
 
-class TestGetRekIscatColor:
+# Returns the expected color for each known rek_iscat value (case-insensitive)
+@pytest.mark.parametrize(
+    "val,expected",
+    [
+        ("true", "green"),
+        ("TRUE", "green"),
+        ("false", "red"),
+        ("FALSE", "red"),
+        ("N/A", "red"),
+    ],
+)
+def test_color(val, expected):
+    """
+    Test that the function returns the expected color for each known `rek_iscat` value.
+
+    Args:
+        val: The `rek_iscat` value passed to the function.
+        expected: The color the function should return.
+
+    Asserts:
+        - The returned color matches the expected color.
+    """
+    assert get_rek_iscat_color(val) == expected
+
+
+def _case_variants(word):
     """
-    Test suite for the `get_rek_iscat_color` function.
+    Return every upper/lower-case spelling of `word`.
+
+    Args:
+        word (str): The word to vary.
+
+    Returns:
+        set: All case variants of the word, e.g. "true", "True", "tRuE", ...
+    """
+    return {
+        "".join(chars)
+        for chars in itertools.product(*((c.lower(), c.upper()) for c in word))
+    }
+
+
+# Ignores case for "true"/"false" and falls back to "yellow" for anything else
+def test_color_case_insensitive():
+    """
+    Test that every case variant of "true" and "false" maps to the same color, and that
+    unexpected values fall back to the default color.
+
+    Asserts:
+        - Every case variant of "true" returns "green".
+        - Every case variant of "false" returns "red".
+        - Unexpected values return "yellow".
     """
+    for variant in _case_variants("true"):
+        assert get_rek_iscat_color(variant) == "green"
+
+    for variant in _case_variants("false"):
+        assert get_rek_iscat_color(variant) == "red"
 
-    # Returns "green" when input is "true"
-    def test_returns_green_for_true(self):
-        """
-        Test that the function returns "green" when the input is "true".
-
-        Asserts:
-            - The returned color is "green".
-        """
-        # Arrange
-        rek_iscat = "true"
-
-        # Act
-        result = get_rek_iscat_color(rek_iscat)
-
-        # Assert
-        assert result == "green"
-
-    # Returns "red" when input is "false"
-    def test_returns_red_for_false(self):
-        """
-        Test that the function returns "red" when the input is "false".
-
-        Asserts:
-            - The returned color is "red".
-        """
-        # Arrange
-        rek_iscat = "false"
-
-        # Act
-        result = get_rek_iscat_color(rek_iscat)
-
-        # Assert
-        assert result == "red"
-
-    # Returns "red" when input is "N/A"
-    def test_returns_red_for_na(self):
-        """
-        Test that the function returns "red" when the input is "N/A".
-
-        Asserts:
-            - The returned color is "red".
-        """
-        # Arrange
-        rek_iscat = "N/A"
-
-        # Act
-        result = get_rek_iscat_color(rek_iscat)
-
-        # Assert
-        assert result == "red"
-
-    # Handles case-insensitive comparison for "true"
-    def test_case_insensitive_true(self):
-        """
-        Test that the function handles case-insensitive comparison for "true".
-
-        Asserts:
-            - The returned color is "green" for input "TRUE".
-        """
-        # Arrange
-        rek_iscat = "TRUE"
-
-        # Act
-        result = get_rek_iscat_color(rek_iscat)
-
-        # Assert
-        assert result == "green"
-
-    # Handles case-insensitive comparison for "false"
-    def test_case_insensitive_false(self):
-        """
-        Test that the function handles case-insensitive comparison for "false".
-
-        Asserts:
-            - The returned color is "red" for input "FALSE".
-        """
-        # Arrange
-        rek_iscat = "FALSE"
-
-        # Act
-        result = get_rek_iscat_color(rek_iscat)
-
-        # Assert
-        assert result == "red"
+    for unexpected in ("", "yes", "n/a", "truee", " true"):
+        assert get_rek_iscat_color(unexpected) == "yellow"
@@ -12,9 +12,13 @@ The tests in this module ensure that:
 - The function handles edge cases such as missing or invalid SSM parameters, non-existent dotenv files, and malformed dotenv files.
 - The function prints debug information when the `debug` flag is set to `True`.
 
+Every test runs against an empty, test-scoped `os.environ` (the `clean_env` fixture), so
+variables set by one test never leak into another.
+
 Dependencies:
 - pytest: For test execution and assertions.
-- unittest.mock: For mocking dependencies and environment variables.
+- unittest.mock: For the `patched_config` and `clean_env` fixtures (see `conftest.py`) and ad-hoc patches.
+- moto: Backs SSM in memory (via `patched_config`) so `fetch_values_from_ssm` runs end to end.
 - api_client.helpers.config.load_environment_variables: The function under test.
 
 Test Cases:
@@ -23,65 +27,119 @@ Test Cases:
 - `test_setting_env_vars_from_ssm`: Verifies that the function sets environment variables correctly after loading from SSM.
 - `test_successful_dotenv_loading`: Ensures the function sets environment variables correctly after loading from a dotenv file.
 - `test_debug_output`: Verifies that the function prints debug information when the `debug` flag is set to `True`.
-- `test_handling_missing_ssm_parameters`: Ensures the function handles missing SSM parameters gracefully.
-- `test_handling_invalid_ssm_parameters`: Verifies that the function handles invalid SSM parameters and raises an appropriate exception.
-- `test_handling_nonexistent_dotenv_file`: Ensures the function handles non-existent dotenv files gracefully.
-- `test_handling_malformed_dotenv_file`: Verifies that the function handles empty or malformed dotenv files gracefully.
-- `test_handling_missing_required_env_vars`: Ensures the function handles missing required environment variables after loading.
+- `test_handling_error_paths`: Parametrized over missing and invalid SSM parameters, non-existent and
+  malformed dotenv files, and missing required environment variables; ensures the function exits with
+  the correct code.
 """
 
 import os
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 from botocore.exceptions import ClientError
 
+import api_client.helpers.config as _cfg
 from api_client.helpers.config import load_environment_variables
 
+# Read-only SSM parameters seeded into the moto backend by tests
+_SSM_RESPONSE = MappingProxyType(
+    {
+        "prefix/AWS_ACCESS_KEY_ID": "test_key",
+        "prefix/AWS_SECRET_ACCESS_KEY": "test_secret",
+        "prefix/AWS_REGION": "us-west-2",
+        "prefix/FUNC_BULKIMG_ANALYSER_NAME": "test_func",
+        "prefix/S3BUCKET_SOURCE": "test_bucket",
+        "prefix/DYNAMODB_TABLE_NAME": "test_table",
+    }
+)
+_SSM_KEYS = tuple(_SSM_RESPONSE)
+
+# Simulated ClientError from boto3 for an invalid SSM parameter
+_INVALID_PARAM_ERROR = ClientError(
+    {"Error": {"Code": "InvalidParameter", "Message": "Parameter not found"}},
+    "GetParameters",
+)
+
+# Variables written by the mocked `load_dotenv` in the successful dotenv test
+_DOTENV_EXPECTED = MappingProxyType(
+    {
+        "AWS_ACCESS_KEY_ID": "dotenv_key",
+        "AWS_SECRET_ACCESS_KEY": "dotenv_secret",
+        "AWS_REGION": "eu-west-1",
+        "FUNC_BULKIMG_ANALYSER_NAME": "dotenv_func",
+        "S3BUCKET_SOURCE": "dotenv_bucket",
+        "DYNAMODB_TABLE_NAME": "dotenv_table",
+    }
+)
+
+
+def _set_all_dotenv_vars(path, override):
+    """
+    Stand-in for `load_dotenv` that sets every variable in `_DOTENV_EXPECTED`.
+
+    Args:
+        path (str): The dotenv path (ignored).
+        override (bool): The override flag (ignored).
+
+    Returns:
+        bool: Always True, as `load_dotenv` does when variables were loaded.
+    """
+    os.environ.update(_DOTENV_EXPECTED)
+    return True
+
+
+def _put_parameters(ssm_client, parameters):
+    """
+    Seed the moto SSM backend with string parameters.
+
+    Args:
+        ssm_client: The moto-backed SSM client from the `patched_config` fixture.
+        parameters (Mapping): Parameter names mapped to their values.
+    """
+    for name, value in parameters.items():
+        ssm_client.put_parameter(Name=name, Value=value, Type="String")
+
 
+@pytest.mark.usefixtures("clean_env")
 class TestLoadEnvironmentVariables:
     """
     Test suite for the `load_environment_variables` function.
     """
 
     # Loading environment variables from SSM when secretsfile is "ssm"
-    def test_load_from_ssm(self, mocker):
+    def test_load_from_ssm(self, patched_config):
         """
         Test that the function loads environment variables from SSM when `secretsfile` is "ssm".
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            patched_config: Fixture patching the collaborators of `load_environment_variables`.
 
         Asserts:
             - The `fetch_values_from_ssm` function is called with the correct parameters.
             - The environment variables are set correctly after loading.
         """
         # Arrange
-        mock_ssm_client = mocker.Mock()
-        mock_fetch = mocker.patch(
-            "api_client.helpers.config.fetch_values_from_ssm",
-            return_value={
+        _put_parameters(
+            patched_config.ssm_client,
+            {
                 "prefix/AWS_ACCESS_KEY_ID": "test_key",
                 "prefix/AWS_SECRET_ACCESS_KEY": "test_secret",
                 "prefix/AWS_REGION": "us-west-2",
             },
         )
-        mocker.patch("api_client.helpers.config.ssm_client", mock_ssm_client)
-        mocker.patch("api_client.helpers.config.check_env_variables", return_value=True)
-        mocker.patch(
-            "api_client.helpers.config.ssm_keys",
-            [
-                "prefix/AWS_ACCESS_KEY_ID",
-                "prefix/AWS_SECRET_ACCESS_KEY",
-                "prefix/AWS_REGION",
-            ],
-        )
+        patched_config.ssm_keys[:] = [
+            "prefix/AWS_ACCESS_KEY_ID",
+            "prefix/AWS_SECRET_ACCESS_KEY",
+            "prefix/AWS_REGION",
+        ]
 
         # Act
         load_environment_variables("ssm")
 
         # Assert
-        mock_fetch.assert_called_once_with(
-            mock_ssm_client,
+        patched_config.fetch.assert_called_once_with(
+            patched_config.ssm_client,
             [
                 "prefix/AWS_ACCESS_KEY_ID",
                 "prefix/AWS_SECRET_ACCESS_KEY",
@@ -93,278 +151,174 @@ class TestLoadEnvironmentVariables:
         assert os.environ.get("AWS_REGION") == "us-west-2"
 
     # Loading environment variables from a dotenv file when secretsfile is not "ssm"
-    def test_load_from_dotenv_file(self, mocker):
+    def test_load_from_dotenv_file(self, patched_config):
         """
         Test that the function loads environment variables from a dotenv file when `secretsfile` is not "ssm".
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            patched_config: Fixture patching the collaborators of `load_environment_variables`.
 
         Asserts:
             - The `construct_secrets_path` function is called with the correct filename.
             - The `load_dotenv` function is called with the correct path.
         """
-        # Arrange
-        mock_construct_path = mocker.patch(
-            "api_client.helpers.config.construct_secrets_path",
-            return_value="/path/to/.env",
-        )
-        mock_load_dotenv = mocker.patch("api_client.helpers.config.load_dotenv")
-        mocker.patch("api_client.helpers.config.check_env_variables", return_value=True)
-
         # Act
         load_environment_variables("dev.env")
 
         # Assert
-        mock_construct_path.assert_called_once_with(secret_filename="dev.env")
-        mock_load_dotenv.assert_called_once_with("/path/to/.env", override=True)
+        patched_config.construct_path.assert_called_once_with(secret_filename="dev.env")
+        patched_config.load_dotenv.assert_called_once_with(
+            "/path/to/.env", override=True
+        )
 
     # Successfully setting environment variables from SSM parameters
-    def test_setting_env_vars_from_ssm(self, mocker):
+    def test_setting_env_vars_from_ssm(self, patched_config):
         """
         Test that the function sets environment variables correctly after loading from SSM.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            patched_config: Fixture patching the collaborators of `load_environment_variables`.
 
         Asserts:
             - The environment variables are set correctly for each key-value pair.
         """
         # Arrange
-        ssm_response = {
-            "prefix/AWS_ACCESS_KEY_ID": "test_key",
-            "prefix/AWS_SECRET_ACCESS_KEY": "test_secret",
-            "prefix/AWS_REGION": "us-west-2",
-            "prefix/FUNC_BULKIMG_ANALYSER_NAME": "test_func",
-            "prefix/S3BUCKET_SOURCE": "test_bucket",
-            "prefix/DYNAMODB_TABLE_NAME": "test_table",
-        }
-        mocker.patch(
-            "api_client.helpers.config.fetch_values_from_ssm", return_value=ssm_response
-        )
-        mocker.patch("api_client.helpers.config.check_env_variables", return_value=True)
-        mocker.patch("api_client.helpers.config.ssm_keys", list(ssm_response.keys()))
+        _put_parameters(patched_config.ssm_client, _SSM_RESPONSE)
+        patched_config.ssm_keys[:] = _SSM_KEYS
 
         # Act
         load_environment_variables("ssm")
 
         # Assert
-        for key, value in ssm_response.items():
+        for key, value in _SSM_RESPONSE.items():
             env_key = key.split("/")[-1]
             assert os.environ.get(env_key) == value
 
     # Successfully loading environment variables from dotenv file
-    def test_successful_dotenv_loading(self, mocker):
+    def test_successful_dotenv_loading(self, patched_config):
         """
         Test that the function sets environment variables correctly after loading from a dotenv file.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            patched_config: Fixture patching the collaborators of `load_environment_variables`.
 
         Asserts:
             - The environment variables are set correctly for each key-value pair.
         """
         # Arrange
-        mock_construct_path = mocker.patch(
-            "api_client.helpers.config.construct_secrets_path",
-            return_value="/path/to/.env",
-        )
-
-        # Mock load_dotenv to set environment variables
-        def mock_load_dotenv_effect(path, override):
-            os.environ["AWS_ACCESS_KEY_ID"] = "dotenv_key"
-            os.environ["AWS_SECRET_ACCESS_KEY"] = "dotenv_secret"
-            os.environ["AWS_REGION"] = "eu-west-1"
-            os.environ["FUNC_BULKIMG_ANALYSER_NAME"] = "dotenv_func"
-            os.environ["S3BUCKET_SOURCE"] = "dotenv_bucket"
-            os.environ["DYNAMODB_TABLE_NAME"] = "dotenv_table"
-            return True
-
-        mock_load_dotenv = mocker.patch(
-            "api_client.helpers.config.load_dotenv", side_effect=mock_load_dotenv_effect
-        )
-        mocker.patch("api_client.helpers.config.check_env_variables", return_value=True)
+        patched_config.load_dotenv.side_effect = _set_all_dotenv_vars
 
         # Act
         load_environment_variables("dev.env")
 
         # Assert
-        assert os.environ.get("AWS_ACCESS_KEY_ID") == "dotenv_key"
-        assert os.environ.get("AWS_SECRET_ACCESS_KEY") == "dotenv_secret"
-        assert os.environ.get("AWS_REGION") == "eu-west-1"
-        assert os.environ.get("FUNC_BULKIMG_ANALYSER_NAME") == "dotenv_func"
-        assert os.environ.get("S3BUCKET_SOURCE") == "dotenv_bucket"
-        assert os.environ.get("DYNAMODB_TABLE_NAME") == "dotenv_table"
+        for key, value in _DOTENV_EXPECTED.items():
+            assert os.environ[key] == value
 
     # Printing debug information when debug flag is True
-    def test_debug_output(self, mocker):
+    @patch.object(_cfg, "secret_vars", ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"])
+    def test_debug_output(self, patched_config, capsys):
         """
         Test that the function prints debug information when the `debug` flag is set to `True`.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            patched_config: Fixture patching the collaborators of `load_environment_variables`.
+            capsys: The pytest fixture for capturing stdout and stderr.
 
         Asserts:
             - Debug information is printed for each environment variable.
         """
         # Arrange
-        mocker.patch(
-            "api_client.helpers.config.fetch_values_from_ssm",
-            return_value={
+        _put_parameters(
+            patched_config.ssm_client,
+            {
                 "prefix/AWS_ACCESS_KEY_ID": "test_key",
                 "prefix/AWS_SECRET_ACCESS_KEY": "test_secret",
             },
         )
-        mocker.patch("api_client.helpers.config.check_env_variables", return_value=True)
-        mocker.patch(
-            "api_client.helpers.config.ssm_keys",
-            ["prefix/AWS_ACCESS_KEY_ID", "prefix/AWS_SECRET_ACCESS_KEY"],
-        )
-        mocker.patch(
-            "api_client.helpers.config.secret_vars",
-            ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"],
-        )
-        mock_print = mocker.patch("api_client.helpers.config.print")
+        patched_config.ssm_keys[:] = [
+            "prefix/AWS_ACCESS_KEY_ID",
+            "prefix/AWS_SECRET_ACCESS_KEY",
+        ]
 
         # Act
         load_environment_variables("ssm", debug=True)
 
         # Assert
-        debug_calls = [
-            call
-            for call in mock_print.call_args_list
-            if "Retrieved env vars" in str(call)
-        ]
-        assert len(debug_calls) > 0
-        assert mock_print.call_count > 3  # At least a few debug prints should happen
-
-    # Handling missing SSM parameters
-    def test_handling_missing_ssm_parameters(self, mocker):
-        """
-        Test that the function handles missing SSM parameters gracefully.
-
-        Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
-
-        Asserts:
-            - The function raises a `SystemExit` exception with the correct exit code.
-        """
-        # Arrange
-        mocker.patch(
-            "api_client.helpers.config.fetch_values_from_ssm",
-            side_effect=SystemExit(42),
-        )
-        mocker.patch("api_client.helpers.config.ssm_keys", ["prefix/MISSING_KEY"])
-
-        # Act & Assert
-        with pytest.raises(SystemExit) as excinfo:
-            load_environment_variables("ssm")
-
-        assert excinfo.value.code == 42
-
-    # Handling invalid SSM parameters
-    def test_handling_invalid_ssm_parameters(self, mocker):
-        """
-        Test that the function handles invalid SSM parameters and raises an appropriate exception.
-
-        Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
-
-        Asserts:
-            - The function raises a `SystemExit` exception with the correct exit code.
-        """
-        # Arrange
-        # Simulate ClientError from boto3
-        mock_error = ClientError(
-            {"Error": {"Code": "InvalidParameter", "Message": "Parameter not found"}},
-            "GetParameters",
-        )
-        mocker.patch(
-            "api_client.helpers.config.fetch_values_from_ssm", side_effect=mock_error
-        )
-        mocker.patch("api_client.helpers.config.ssm_keys", ["prefix/INVALID_KEY"])
-
-        # Act & Assert
-        with pytest.raises(SystemExit) as excinfo:
-            load_environment_variables("ssm")
-
-        assert excinfo.value.code == 1
-
-    # Handling non-existent dotenv file path
-    def test_handling_nonexistent_dotenv_file(self, mocker):
-        """
-        Test that the function handles non-existent dotenv files gracefully.
-
-        Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
-
-        Asserts:
-            - The function raises a `SystemExit` exception with the correct exit code.
+        captured = capsys.readouterr()
+        assert "Retrieved env vars" in captured.out
+        assert captured.out.count("\n") > 3  # At least a few debug prints should happen
+
+    # Exiting when SSM or dotenv loading fails, or required env vars are missing
+    @pytest.mark.parametrize(
+        "secretsfile,ssm_keys,overrides,expected_code",
+        [
+            pytest.param(
+                "ssm",
+                # Never seeded, so SSM reports it under InvalidParameters
+                ["prefix/MISSING_KEY"],
+                {},
+                42,
+                id="missing_ssm_parameters",
+            ),
+            pytest.param(
+                "ssm",
+                ["prefix/INVALID_KEY"],
+                {"fetch.side_effect": _INVALID_PARAM_ERROR},
+                1,
+                id="invalid_ssm_parameters",
+            ),
+            pytest.param(
+                "nonexistent.env",
+                [],
+                {"construct_path.side_effect": SystemExit(1)},
+                1,
+                id="nonexistent_dotenv_file",
+            ),
+            pytest.param(
+                "empty.env",
+                [],
+                # load_dotenv returns False if file is empty or malformed
+                {"load_dotenv.return_value": False, "check.return_value": False},
+                1,
+                id="malformed_dotenv_file",
+            ),
+            pytest.param(
+                "dev.env",
+                [],
+                {"check.return_value": False},
+                1,
+                id="missing_required_env_vars",
+            ),
+        ],
+    )
+    def test_handling_error_paths(
+        self, patched_config, secretsfile, ssm_keys, overrides, expected_code
+    ):
         """
-        # Arrange
-        mocker.patch(
-            "api_client.helpers.config.construct_secrets_path",
-            side_effect=SystemExit(1),
-        )
-
-        # Act & Assert
-        with pytest.raises(SystemExit) as excinfo:
-            load_environment_variables("nonexistent.env")
-
-        assert excinfo.value.code == 1
-
-    # Handling empty or malformed dotenv file
-    def test_handling_malformed_dotenv_file(self, mocker):
-        """
-        Test that the function handles empty or malformed dotenv files gracefully.
-
-        Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
-
-        Asserts:
-            - The function raises a `SystemExit` exception with the correct exit code.
-        """
-        # Arrange
-        mocker.patch(
-            "api_client.helpers.config.construct_secrets_path",
-            return_value="/path/to/empty.env",
-        )
-        mocker.patch(
-            "api_client.helpers.config.load_dotenv", return_value=False
-        )  # load_dotenv returns False if file is empty or malformed
-        mocker.patch(
-            "api_client.helpers.config.check_env_variables", return_value=False
-        )  # No env vars were loaded
+        Test that the function exits with the correct code when loading fails.
 
-        # Act & Assert
-        with pytest.raises(SystemExit) as excinfo:
-            load_environment_variables("empty.env")
-
-        assert excinfo.value.code == 1
-
-    # Handling missing required environment variables after loading
-    def test_handling_missing_required_env_vars(self, mocker):
-        """
-        Test that the function handles missing required environment variables after loading.
+        Covers missing and invalid SSM parameters, non-existent and malformed dotenv files,
+        and required environment variables that are still missing after loading.
 
         Args:
-            mocker: The pytest-mock fixture for mocking dependencies.
+            patched_config: Fixture patching the collaborators of `load_environment_variables`.
+            secretsfile (str): The secrets file name or "ssm".
+            ssm_keys (list): The SSM parameter names to request.
+            overrides (dict): `"<mock>.<attribute>"` keys set on `patched_config` mocks.
+            expected_code (int): The expected `SystemExit` code.
 
         Asserts:
             - The function raises a `SystemExit` exception with the correct exit code.
         """
         # Arrange
-        mocker.patch(
-            "api_client.helpers.config.construct_secrets_path",
-            return_value="/path/to/.env",
-        )
-        mocker.patch("api_client.helpers.config.load_dotenv")
-        mocker.patch(
-            "api_client.helpers.config.check_env_variables", return_value=False
-        )  # Simulate missing required env vars
+        patched_config.ssm_keys[:] = ssm_keys
+        for target, value in overrides.items():
+            mock_name, attr = target.split(".")
+            setattr(getattr(patched_config, mock_name), attr, value)
 
         # Act & Assert
         with pytest.raises(SystemExit) as excinfo:
-            load_environment_variables("dev.env")
+            load_environment_variables(secretsfile)
 
-        assert excinfo.value.code == 1
+        assert excinfo.value.code == expected_code
@@ -17,26 +17,47 @@ The tests in this module ensure that:
 Dependencies:
 - pytest: For test execution and assertions.
 - json: For handling JSON encoding and decoding.
+- pytest-mock: For spying on `builtins.open`.
+- math: For checking NaN values read back from batch files.
 - api_client.helpers.general.read_batch_file: The function under test.
 
 Test Cases:
 - `test_reads_valid_json_file`: Verifies that the function successfully reads a valid JSON file and returns its contents as a dictionary.
 - `test_handles_utf8_encoded_files`: Ensures the function handles UTF-8 encoded files correctly.
+- `test_raises_value_error_for_invalid_utf8`: Ensures the function raises a `ValueError` for files that are not valid UTF-8.
 - `test_returns_expected_dictionary_structure`: Verifies that the function returns the expected dictionary structure for valid batch files.
 - `test_properly_closes_file_after_reading`: Ensures the function properly closes files after reading.
+- `test_accepts_pathlike_paths`: Verifies that the function accepts `os.PathLike` paths as well as strings.
 - `test_raises_file_not_found_error`: Verifies that the function raises a `FileNotFoundError` when the batch file does not exist.
 - `test_raises_value_error_for_invalid_json`: Ensures the function raises a `ValueError` with an appropriate message for invalid JSON files.
 - `test_handles_empty_json_files`: Verifies that the function handles empty JSON files correctly by returning an empty dictionary.
 - `test_handles_large_json_files`: Ensures the function handles large JSON files without memory issues.
+- `test_handles_files_above_mmap_threshold`: Verifies that the function reads JSON files above the memory-map threshold.
+- `test_raises_value_error_for_invalid_large_json`: Ensures invalid JSON above the large-file parser threshold raises a `ValueError`.
+- `test_handles_big_integers_in_large_json`: Verifies that integers wider than 64 bits are read intact from files above the large-file parser threshold.
+- `test_round_trips_values_from_write_batch_file`: Verifies that NaN, Infinity and big integers written by `write_batch_file` are read back intact.
 - `test_handles_nested_json_structures`: Verifies that the function handles JSON files with nested structures correctly.
+- `test_caches_until_file_changes`: Verifies that unchanged files are served from the cache and changed files are re-read.
+- `test_mutating_result_does_not_affect_later_reads`: Ensures that mutating a returned result does not change later reads.
+- `test_returns_read_only_view_when_requested`: Verifies that `readonly=True` returns a read-only view of the contents.
+- `test_returns_read_only_view_of_record_list`: Verifies that `readonly=True` returns a read-only view of a list of records.
+- `test_readonly_view_is_read_only_at_every_depth`: Ensures nested data in a `readonly=True` result cannot be mutated.
 - `test_preserves_original_exception`: Ensures the function preserves the original exception when JSON decoding fails.
 """
 
+import builtins
 import json
+import math
 
 import pytest
 
-from api_client.helpers.general import read_batch_file
+from api_client.helpers import general
+from api_client.helpers.general import (
+    MMAP_MIN_BYTES,
+    SIMDJSON_MIN_BYTES,
+    read_batch_file,
+    write_batch_file,
+)
 
 
 class TestReadBatchFile:
@@ -99,6 +120,27 @@ class TestReadBatchFile:
             == "Unicode value with special chars: 你好, こんにちは, Привет"
         )
 
+    # Raises ValueError when the file is not valid UTF-8
+    def test_raises_value_error_for_invalid_utf8(self, tmp_path):
+        """
+        Test that the function raises a `ValueError` when the file is not valid UTF-8.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - A `ValueError` is raised with the correct error message.
+        """
+        # Arrange
+        invalid_utf8_file = tmp_path / "invalid_utf8_batch.json"
+        invalid_utf8_file.write_bytes(b'{"key": "\xff\xfe"}')
+
+        # Act & Assert
+        with pytest.raises(ValueError) as excinfo:
+            read_batch_file(str(invalid_utf8_file))
+
+        assert "Error decoding JSON from batch file" in str(excinfo.value)
+
     # Returns the expected dictionary structure from a valid batch file
     def test_returns_expected_dictionary_structure(self, tmp_path):
         """
@@ -133,49 +175,59 @@ class TestReadBatchFile:
         assert len(result["items"]) == 2
 
     # Properly closes the file after reading (using context manager)
-    def test_properly_closes_file_after_reading(self, tmp_path, monkeypatch):
+    def test_properly_closes_file_after_reading(self, tmp_path, mocker):
         """
-        Test that the function properly closes the file after reading (using a context manager).
+        Test that the function properly closes files after reading.
 
         Args:
             tmp_path: The pytest fixture for creating temporary file paths.
-            monkeypatch: The pytest fixture for mocking built-in functions.
+            mocker: The pytest-mock fixture, used to spy on `builtins.open`.
 
         Asserts:
-            - The file is properly closed after reading.
+            - The file is opened once and properly closed after reading.
         """
         # Arrange
+        read_batch_file.cache_clear()
         test_data = {"key": "value"}
         batch_file = tmp_path / "close_test_batch.json"
         with open(batch_file, "w", encoding="utf-8") as f:
             json.dump(test_data, f)
 
-        # Mock the open function to track if it's properly closed
-        original_open = open
-        file_closed = False
+        # Spy on open so the real file object is returned and recorded
+        open_spy = mocker.spy(builtins, "open")
 
-        class MockFile:
-            def __init__(self, *args, **kwargs):
-                self.file = original_open(*args, **kwargs)
+        # Act
+        read_batch_file(str(batch_file))
 
-            def __enter__(self):
-                return self.file
+        # Assert
+        assert open_spy.call_count == 1
+        assert open_spy.spy_return.closed is True
 
-            def __exit__(self, *args, **kwargs):
-                nonlocal file_closed
-                file_closed = True
-                return self.file.__exit__(*args, **kwargs)
+    # Accepts os.PathLike paths as well as strings
+    def test_accepts_pathlike_paths(self, tmp_path):
+        """
+        Test that the function accepts a `pathlib.Path` as well as a string path.
 
-            def __getattr__(self, name):
-                return getattr(self.file, name)
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
 
-        monkeypatch.setattr("builtins.open", MockFile)
+        Asserts:
+            - The returned dictionary matches the expected data.
+            - A missing `pathlib.Path` is reported with its path in the error message.
+        """
+        # Arrange
+        test_data = {"key": "value"}
+        batch_file = tmp_path / "pathlike_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(test_data, f)
 
         # Act
-        read_batch_file(str(batch_file))
+        result = read_batch_file(batch_file)
 
         # Assert
-        assert file_closed is True
+        assert result == test_data
+        with pytest.raises(FileNotFoundError, match="does_not_exist.json"):
+            read_batch_file(tmp_path / "does_not_exist.json")
 
     # Raises FileNotFoundError when the batch file does not exist
     def test_raises_file_not_found_error(self, tmp_path):
@@ -261,8 +313,8 @@ class TestReadBatchFile:
         # Arrange
         large_json_file = tmp_path / "large.json"
         large_data = {"items": [{"id": i, "data": "x" * 1000} for i in range(1000)]}
-        with open(large_json_file, "w", encoding="utf-8") as f:
-            json.dump(large_data, f)
+        # json.dumps encodes in one C call; json.dump streams many small chunks
+        large_json_file.write_text(json.dumps(large_data), encoding="utf-8")
 
         # Act
         result = read_batch_file(str(large_json_file))
@@ -273,6 +325,117 @@ class TestReadBatchFile:
         assert result["items"][999]["id"] == 999
         assert len(result["items"][0]["data"]) == 1000
 
+    # Reads files above the memory-map threshold
+    def test_handles_files_above_mmap_threshold(self, tmp_path):
+        """
+        Test that the function reads a JSON file larger than `MMAP_MIN_BYTES`, which is
+        memory-mapped instead of read into memory when a buffer-capable parser is installed.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The file is larger than the memory-map threshold.
+            - The returned data matches the data written to the file.
+        """
+        # Arrange
+        mmap_json_file = tmp_path / "mmap.json"
+        mmap_data = {"items": [{"id": i, "data": "x" * 1024} for i in range(1100)]}
+        mmap_json_file.write_text(json.dumps(mmap_data), encoding="utf-8")
+
+        # Act
+        result = read_batch_file(str(mmap_json_file))
+
+        # Assert
+        assert mmap_json_file.stat().st_size > MMAP_MIN_BYTES
+        assert result == mmap_data
+
+    # Raises ValueError for invalid JSON above the large-file parser threshold
+    def test_raises_value_error_for_invalid_large_json(self, tmp_path):
+        """
+        Test that the function raises a `ValueError` for an invalid JSON file larger than
+        `SIMDJSON_MIN_BYTES`, which takes the large-file parser path when simdjson is installed.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - A `ValueError` is raised with the correct error message.
+            - The original parser exception is preserved as the cause.
+        """
+        # Arrange
+        invalid_json_file = tmp_path / "invalid_large.json"
+        with open(invalid_json_file, "w", encoding="utf-8") as f:
+            f.write("[" + "1," * SIMDJSON_MIN_BYTES + "invalid")
+
+        # Act & Assert
+        with pytest.raises(ValueError) as excinfo:
+            read_batch_file(str(invalid_json_file))
+
+        assert "Error decoding JSON from batch file" in str(excinfo.value)
+        assert excinfo.value.__cause__ is not None
+
+    # Reads integers wider than 64 bits above the large-file parser threshold
+    def test_handles_big_integers_in_large_json(self, tmp_path):
+        """
+        Test that a JSON file larger than `SIMDJSON_MIN_BYTES` holding an integer wider than
+        64 bits is read with the integer intact, even though simdjson cannot represent it.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The file is larger than the large-file parser threshold.
+            - The big integer is returned as the exact `int`.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        big_int_file = tmp_path / "big_int_large.json"
+        big_int_data = {"items": ["x" * 1024] * 80, "big": 2**70}
+        big_int_file.write_text(json.dumps(big_int_data), encoding="utf-8")
+
+        # Act
+        result = read_batch_file(str(big_int_file))
+
+        # Assert
+        assert big_int_file.stat().st_size > SIMDJSON_MIN_BYTES
+        assert result == big_int_data
+        assert isinstance(result["big"], int)
+
+    # Reads back NaN, Infinity and big integers written by write_batch_file
+    @pytest.mark.parametrize("padding", [0, SIMDJSON_MIN_BYTES])
+    def test_round_trips_values_from_write_batch_file(self, tmp_path, padding):
+        """
+        Test that a batch file written by `write_batch_file` with `NaN`, `Infinity` and an
+        integer wider than 64 bits is read back with the same values, for both small files
+        and files above the large-file parser threshold.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+            padding: The number of padding characters added to the file.
+
+        Asserts:
+            - `NaN` and `Infinity` are read back as floats.
+            - The big integer is read back as the exact `int`.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        batch_file = tmp_path / "round_trip_batch.json"
+        records = [
+            {"img_fprint": "abc123", "score": float("nan"), "limit": float("inf")},
+            {"img_fprint": "def456", "big": 2**70, "padding": "x" * padding},
+        ]
+        write_batch_file(str(batch_file), records)
+
+        # Act
+        result = read_batch_file(str(batch_file))
+
+        # Assert
+        assert math.isnan(result[0]["score"])
+        assert result[0]["limit"] == float("inf")
+        assert result[1]["big"] == 2**70
+        assert isinstance(result[1]["big"], int)
+
     # Handles JSON files with nested structures correctly
     def test_handles_nested_json_structures(self, tmp_path):
         """
@@ -309,6 +472,161 @@ class TestReadBatchFile:
         assert result["array_of_objects"][0]["nested"]["value"] == "nested in array 1"
         assert result["array_of_objects"][1]["nested"]["value"] == "nested in array 2"
 
+    # Serves unchanged files from the cache and re-reads them once they change
+    def test_caches_until_file_changes(self, tmp_path, mocker):
+        """
+        Test that re-reading an unchanged batch file is served from the cache, and that
+        the file is decoded again once its contents change.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+            mocker: The pytest-mock fixture, used to spy on the JSON decoder.
+
+        Asserts:
+            - An unchanged file is decoded only once.
+            - A read after the file changes returns the new contents.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        decode_spy = mocker.spy(general, "_decode_batch_json")
+        batch_file = tmp_path / "cached_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump({"key": "value"}, f)
+
+        # Act
+        first = read_batch_file(str(batch_file))
+        second = read_batch_file(str(batch_file))
+        # A different size changes the cache key even if mtime resolution is coarse
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump({"key": "new value"}, f)
+        third = read_batch_file(str(batch_file))
+
+        # Assert
+        assert second == first == {"key": "value"}
+        assert third == {"key": "new value"}
+        assert decode_spy.call_count == 2
+
+    # Returns a separate copy on each call, so mutating a result does not change the cache
+    def test_mutating_result_does_not_affect_later_reads(self, tmp_path):
+        """
+        Test that mutating the result of one read does not change what later reads of
+        the same unchanged file return.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - A second read returns the original contents after the first result is mutated.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        records = [{"img_fprint": "abc123", "rek_iscat": "true"}]
+        batch_file = tmp_path / "mutated_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+        # Act
+        first = read_batch_file(str(batch_file))
+        first[0]["rek_iscat"] = "[green]true[/green]"
+        first.append({"img_fprint": "def456"})
+        second = read_batch_file(str(batch_file))
+
+        # Assert
+        assert second == records
+
+    # Returns a read-only view of the cached dictionary when readonly=True
+    def test_returns_read_only_view_when_requested(self, tmp_path):
+        """
+        Test that `readonly=True` returns a read-only view over the shared cached dictionary.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The returned view equals the file contents.
+            - Assigning to the view raises a `TypeError`.
+            - The default call still returns a plain dictionary.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        batch_file = tmp_path / "readonly_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump({"key": "value"}, f)
+
+        # Act
+        view = read_batch_file(str(batch_file), readonly=True)
+
+        # Assert
+        assert view == {"key": "value"}
+        with pytest.raises(TypeError):
+            view["key"] = "changed"
+        assert isinstance(read_batch_file(str(batch_file)), dict)
+
+    # Returns a read-only view of a list-shaped batch file when readonly=True
+    def test_returns_read_only_view_of_record_list(self, tmp_path):
+        """
+        Test that `readonly=True` returns a read-only view of a batch file holding a list
+        of records, which is the shape written by `write_batch_file`.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The returned view is a tuple with the file's records.
+            - Neither the tuple nor its records can be modified.
+            - A later default read returns the unchanged records as a list.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        records = [{"img_fprint": "abc123"}, {"img_fprint": "def456"}]
+        batch_file = tmp_path / "readonly_records.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+
+        # Act
+        view = read_batch_file(str(batch_file), readonly=True)
+
+        # Assert
+        assert isinstance(view, tuple)
+        assert [dict(record) for record in view] == records
+        with pytest.raises(TypeError):
+            view[0]["img_fprint"] = "changed"
+        with pytest.raises(AttributeError):
+            view.append({"img_fprint": "ghi789"})
+        assert read_batch_file(str(batch_file)) == records
+
+    # Nested data in a readonly result cannot be changed, and later reads are unaffected
+    def test_readonly_view_is_read_only_at_every_depth(self, tmp_path):
+        """
+        Test that nested lists and dicts in a `readonly=True` result cannot be mutated,
+        so the cached document seen by later reads stays unchanged.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - Nested lists are tuples and nested dicts cannot be assigned to.
+            - A later default read returns the original contents.
+        """
+        # Arrange
+        read_batch_file.cache_clear()
+        data = {"items": [1, 2], "meta": {"tags": ["cat"]}}
+        batch_file = tmp_path / "nested_readonly_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        # Act
+        view = read_batch_file(str(batch_file), readonly=True)
+
+        # Assert
+        with pytest.raises(AttributeError):
+            view["items"].append(99)
+        with pytest.raises(TypeError):
+            view["meta"]["tags"] = []
+        with pytest.raises(AttributeError):
+            view["meta"]["tags"].append("dog")
+        assert read_batch_file(str(batch_file)) == data
+
     # Preserves the original exception when JSON decoding fails
     def test_preserves_original_exception(self, tmp_path):
         """
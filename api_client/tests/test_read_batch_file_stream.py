@@ -0,0 +1,171 @@
+"""
+Module: test_read_batch_file_stream
+
+This module contains unit tests for the `read_batch_file_stream` function in the
+`api_client.helpers.general` module. The `read_batch_file_stream` function is responsible
+for yielding the records of a JSON or JSON Lines batch file one at a time.
+
+The tests in this module ensure that:
+- The function yields each item of a JSON array batch file.
+- The function yields each line of a JSON Lines batch file, skipping blank lines.
+- The function yields a pretty-printed single-object file as one record.
+- The function raises appropriate exceptions for missing or invalid files.
+
+Dependencies:
+- pytest: For test execution and assertions.
+- json: For handling JSON encoding and decoding.
+- api_client.helpers.general.read_batch_file_stream: The function under test.
+
+Test Cases:
+- `test_yields_items_of_json_array`: Verifies that the function yields each item of a JSON array.
+- `test_yields_json_lines_records`: Ensures the function yields one record per non-blank JSON Lines line.
+- `test_yields_single_pretty_printed_object`: Verifies that a multi-line JSON object is yielded as one record.
+- `test_yields_nothing_for_whitespace_only_file`: Ensures a whitespace-only file yields no records.
+- `test_raises_file_not_found_error`: Verifies that the function raises a `FileNotFoundError` when the batch file does not exist.
+- `test_raises_value_error_for_invalid_line`: Ensures the function raises a `ValueError` for an invalid JSON Lines record.
+"""
+
+import json
+
+import pytest
+
+from api_client.helpers.general import read_batch_file_stream
+
+
+class TestReadBatchFileStream:
+    """
+    Test suite for the `read_batch_file_stream` function.
+    """
+
+    # Yields each item of a JSON array batch file, as written by write_batch_file
+    def test_yields_items_of_json_array(self, tmp_path):
+        """
+        Test that the function yields each item of a JSON array batch file.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The yielded records match the items of the array.
+        """
+        # Arrange
+        records = [{"batch_id": "b1"}, {"batch_id": "b2"}]
+        batch_file = tmp_path / "array_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=4)
+
+        # Act
+        result = list(read_batch_file_stream(str(batch_file)))
+
+        # Assert
+        assert result == records
+
+    # Yields one record per non-blank line of a JSON Lines batch file
+    def test_yields_json_lines_records(self, tmp_path):
+        """
+        Test that the function yields one record per non-blank line of a JSON Lines file.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The yielded records match each line, in order.
+        """
+        # Arrange
+        batch_file = tmp_path / "lines_batch.jsonl"
+        batch_file.write_text('{"id": 1}\n\n{"id": 2}\n{"id": 3}\n', encoding="utf-8")
+
+        # Act
+        result = list(read_batch_file_stream(str(batch_file)))
+
+        # Assert
+        assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    # Yields a pretty-printed single-object file as one record
+    def test_yields_single_pretty_printed_object(self, tmp_path):
+        """
+        Test that a JSON object spread over several lines is yielded as one record.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - Exactly one record equal to the object is yielded.
+        """
+        # Arrange
+        test_data = {"key": "value", "nested": {"a": [1, 2]}}
+        batch_file = tmp_path / "object_batch.json"
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(test_data, f, indent=4)
+
+        # Act
+        result = list(read_batch_file_stream(str(batch_file)))
+
+        # Assert
+        assert result == [test_data]
+
+    # Yields nothing for a whitespace-only file
+    def test_yields_nothing_for_whitespace_only_file(self, tmp_path):
+        """
+        Test that a whitespace-only file yields no records.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - No records are yielded.
+        """
+        # Arrange
+        batch_file = tmp_path / "blank_batch.jsonl"
+        batch_file.write_text("  \n\n", encoding="utf-8")
+
+        # Act
+        result = list(read_batch_file_stream(str(batch_file)))
+
+        # Assert
+        assert result == []
+
+    # Raises FileNotFoundError when the batch file does not exist
+    def test_raises_file_not_found_error(self, tmp_path):
+        """
+        Test that the function raises a `FileNotFoundError` when the batch file does not exist.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - A `FileNotFoundError` is raised with the correct error message.
+        """
+        # Arrange
+        non_existent_file = tmp_path / "does_not_exist.jsonl"
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError) as excinfo:
+            list(read_batch_file_stream(str(non_existent_file)))
+
+        assert "Batch file not found" in str(excinfo.value)
+
+    # Raises ValueError when a JSON Lines record is invalid
+    def test_raises_value_error_for_invalid_line(self, tmp_path):
+        """
+        Test that the function raises a `ValueError` when a JSON Lines record is invalid.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - Records before the invalid line are yielded.
+            - A `ValueError` is raised with the original exception as its cause.
+        """
+        # Arrange
+        batch_file = tmp_path / "invalid_batch.jsonl"
+        batch_file.write_text('{"id": 1}\n{invalid\n', encoding="utf-8")
+        stream = read_batch_file_stream(str(batch_file))
+
+        # Act & Assert
+        assert next(stream) == {"id": 1}
+        with pytest.raises(ValueError) as excinfo:
+            next(stream)
+
+        assert "Error decoding JSON from batch file" in str(excinfo.value)
+        assert excinfo.value.__cause__ is not None
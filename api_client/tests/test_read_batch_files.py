@@ -0,0 +1,114 @@
+"""
+Module: test_read_batch_files
+
+This module contains unit tests for the `read_batch_files` function in the
+`api_client.helpers.general` module. The `read_batch_files` function is responsible
+for reading several batch files concurrently and returning their contents in order.
+
+The tests in this module ensure that:
+- The function returns the contents of every batch file in the order given.
+- The function handles empty and single-path inputs.
+- The function raises appropriate exceptions for missing files.
+
+Dependencies:
+- pytest: For test execution and assertions.
+- json: For handling JSON encoding and decoding.
+- api_client.helpers.general.read_batch_files: The function under test.
+
+Test Cases:
+- `test_returns_contents_in_input_order`: Verifies that the function returns each file's contents in input order.
+- `test_handles_empty_and_single_inputs`: Ensures the function handles an empty path list and a single path.
+- `test_raises_file_not_found_error`: Verifies that the function raises a `FileNotFoundError` when any batch file does not exist.
+"""
+
+import json
+
+import pytest
+
+from api_client.helpers.general import read_batch_files
+
+
+def _write_batches(tmp_path, count):
+    """
+    Write `count` small batch files and return their paths with the data written.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+        count (int): The number of batch files to write.
+
+    Returns:
+        tuple: The list of file paths and the list of records written to them.
+    """
+    paths, records = [], []
+    for i in range(count):
+        batch_file = tmp_path / f"batch_{i}.json"
+        record = {"batch_id": f"batch{i}", "index": i}
+        with open(batch_file, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        paths.append(str(batch_file))
+        records.append(record)
+    return paths, records
+
+
+class TestReadBatchFiles:
+    """
+    Test suite for the `read_batch_files` function.
+    """
+
+    # Returns the contents of every batch file in input order
+    def test_returns_contents_in_input_order(self, tmp_path):
+        """
+        Test that the function returns each batch file's contents in the order of the input paths.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The returned list matches the records written, in order.
+        """
+        # Arrange
+        paths, records = _write_batches(tmp_path, 10)
+
+        # Act
+        result = read_batch_files(reversed(paths), max_workers=4)
+
+        # Assert
+        assert result == records[::-1]
+
+    # Handles an empty path list and a single path without a thread pool
+    def test_handles_empty_and_single_inputs(self, tmp_path):
+        """
+        Test that the function handles an empty path list and a single path.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - An empty list is returned for no paths.
+            - A one-item list is returned for a single path.
+        """
+        # Arrange
+        paths, records = _write_batches(tmp_path, 1)
+
+        # Act & Assert
+        assert read_batch_files([]) == []
+        assert read_batch_files(paths) == records
+
+    # Raises FileNotFoundError when any batch file does not exist
+    def test_raises_file_not_found_error(self, tmp_path):
+        """
+        Test that the function raises a `FileNotFoundError` when any batch file does not exist.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - A `FileNotFoundError` naming the missing file is raised.
+        """
+        # Arrange
+        paths, _ = _write_batches(tmp_path, 3)
+        missing = str(tmp_path / "does_not_exist.json")
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError, match="Batch file not found"):
+            read_batch_files([*paths, missing])
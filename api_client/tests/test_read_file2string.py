@@ -10,7 +10,8 @@ The tests in this module ensure that:
 - The function handles UTF-8 encoded files and special characters correctly.
 - The function strips leading and trailing whitespace from the file content.
 - The function handles edge cases such as empty files, files with only whitespace, and non-existent files.
-- The function uses the default read mode "r" when no mode is specified.
+- The function opens the file in binary mode "rb" and decodes it as UTF-8.
+- The function normalizes CRLF and CR line endings to LF as text mode did.
 
 Dependencies:
 - pytest: For test execution and assertions.
@@ -19,11 +20,13 @@ Dependencies:
 Test Cases:
 - `test_reads_file_content_successfully`: Verifies that the function successfully reads a text file and returns its content as a string.
 - `test_strips_whitespace_from_content`: Ensures the function strips leading and trailing whitespace from the file content.
-- `test_uses_default_read_mode`: Verifies that the function uses the default read mode "r" when no mode is specified.
+- `test_uses_default_read_mode`: Verifies that the function opens the file in binary mode "rb" when no mode is specified.
 - `test_handles_utf8_encoded_files`: Ensures the function handles UTF-8 encoded files correctly.
 - `test_returns_none_for_nonexistent_file`: Verifies that the function returns `None` when the file does not exist.
 - `test_handles_empty_file`: Ensures the function handles empty files correctly by returning an empty string.
 - `test_handles_whitespace_only_file`: Verifies that the function handles files with only whitespace characters correctly by returning an empty string.
+- `test_strips_unicode_whitespace`: Ensures the function strips non-ASCII whitespace such as NBSP and U+2028.
+- `test_normalizes_line_endings`: Verifies that CRLF and CR line endings are returned as LF.
 - `test_handles_special_characters`: Ensures the function handles files with special characters using UTF-8 encoding.
 """
 
@@ -78,17 +81,17 @@ class TestReadFile2string:
         # Assert
         assert result == "Hello, world!"
 
-    # Opens file with default read mode "r" when no mode is specified
+    # Opens file in binary mode "rb" when no mode is specified
     def test_uses_default_read_mode(self, tmp_path, monkeypatch):
         """
-        Test that the function uses the default read mode "r" when no mode is specified.
+        Test that the function opens the file in binary mode "rb" when no mode is specified.
 
         Args:
             tmp_path: The pytest fixture for creating temporary file paths.
             monkeypatch: The pytest fixture for mocking built-in functions.
 
         Asserts:
-            - The file is opened in read mode "r".
+            - The file is opened in binary read mode "rb".
             - The returned string matches the expected content of the file.
         """
         # Arrange
@@ -99,7 +102,7 @@ class TestReadFile2string:
         original_open = open
 
         def mock_open(file, mode, **kwargs):
-            assert mode == "r"
+            assert mode == "rb"
             return original_open(file, mode, **kwargs)
 
         monkeypatch.setattr("builtins.open", mock_open)
@@ -208,6 +211,50 @@ class TestReadFile2string:
         # Assert
         assert result == ""
 
+    # Strips non-ASCII whitespace such as NBSP and the line separator
+    def test_strips_unicode_whitespace(self, tmp_path):
+        """
+        Test that leading and trailing Unicode whitespace, not just ASCII whitespace, is
+        stripped from the file content.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - NBSP (U+00A0) and LINE SEPARATOR (U+2028) are removed from both ends.
+        """
+        # Arrange
+        unicode_ws_file = tmp_path / "unicode_whitespace.txt"
+        unicode_ws_file.write_text("\u00a0client123\u2028\n", encoding="utf-8")
+
+        # Act
+        result = read_file_2string(str(unicode_ws_file))
+
+        # Assert
+        assert result == "client123"
+
+    # Normalizes Windows (CRLF) and old Mac (CR) line endings to LF
+    def test_normalizes_line_endings(self, tmp_path):
+        """
+        Test that CRLF and lone CR line endings are returned as LF, as text mode's
+        universal newlines would return them.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The returned string uses LF for every line ending.
+        """
+        # Arrange
+        crlf_file = tmp_path / "crlf.txt"
+        crlf_file.write_bytes(b"line1\r\nline2\rline3\r\n")
+
+        # Act
+        result = read_file_2string(str(crlf_file))
+
+        # Assert
+        assert result == "line1\nline2\nline3"
+
     # Handles files with special characters using UTF-8 encoding
     def test_handles_special_characters(self, tmp_path):
         """
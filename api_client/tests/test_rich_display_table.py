@@ -14,197 +14,249 @@ The tests in this module ensure that:
 Dependencies:
 - pytest: For test execution and assertions.
 - unittest.mock: For mocking dependencies and verifying function behavior.
+- types.MappingProxyType: Keeps the session-scoped input fixtures read-only.
 - api_client.helpers.rich_printer.rich_display_table: The function under test.
 
+Fixtures:
+- `alice_data`: A session-scoped, read-only data row for Alice.
+- `alice_bob_data`: Session-scoped, read-only data rows for Alice and Bob.
+- `name_age_columns`: Session-scoped, read-only "Name" and "Age" column definitions.
+- `shared_table_mock`: A class-scoped `Table` mock, reset before each test that uses it.
+- `mock_table`: Patches `Table` in `rich_printer` with the shared mock for tests that inspect the table calls.
+
 Test Cases:
 - `test_display_table_with_valid_data`: Verifies that the function displays a table with valid data and column definitions.
 - `test_display_table_with_custom_title`: Ensures the function supports custom table titles.
-- `test_display_table_with_custom_column_styles`: Verifies that the function applies custom styles to columns.
-- `test_display_table_with_different_justifications`: Ensures the function supports different column justifications.
-- `test_display_table_with_no_wrap_option`: Verifies that the function handles the `no_wrap` option for specific columns.
+- `test_display_table_with_column_options`: Parametrized over custom column styles, different justifications
+  and the `no_wrap` option; verifies that each column's options are passed to `add_column`.
 - `test_raise_value_error_when_columns_is_none`: Ensures the function raises a `ValueError` when the `columns` parameter is `None`.
 - `test_handle_empty_data_list`: Verifies that the function handles empty data lists correctly.
 - `test_process_data_with_missing_keys`: Ensures the function handles missing keys in the data by displaying "N/A".
 - `test_handle_non_string_values`: Verifies that the function converts non-string values to strings before displaying them.
 """
 
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from api_client.helpers.rich_printer import rich_display_table
 
 
-class TestRichDisplayTable:
+### Fixtures
+@pytest.fixture(scope="session")
+def alice_data():
     """
-    Test suite for the `rich_display_table` function.
+    A single read-only data row for Alice.
+
+    Returns:
+        tuple: One read-only row mapping.
     """
+    return (MappingProxyType({"name": "Alice", "age": 30}),)
 
-    # Display a table with valid data and column definitions
-    def test_display_table_with_valid_data(self):
-        """
-        Test that the function displays a table with valid data and column definitions.
 
-        Asserts:
-            - The function does not raise any exceptions when displaying valid data.
-        """
+@pytest.fixture(scope="session")
+def alice_bob_data():
+    """
+    Read-only data rows for Alice and Bob.
 
-        data = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
-        columns = [{"header": "Name", "key": "name"}, {"header": "Age", "key": "age"}]
+    Returns:
+        tuple: Two read-only row mappings.
+    """
+    return (
+        MappingProxyType({"name": "Alice", "age": 30}),
+        MappingProxyType({"name": "Bob", "age": 25}),
+    )
 
-        # Since the function prints to console, we're testing it doesn't raise exceptions
-        rich_display_table(data, title="Test Table", columns=columns)
-        # If we reach here without exception, the test passes
 
-    # Display a table with a custom title
-    def test_display_table_with_custom_title(self):
-        """
-        Test that the function supports custom table titles.
+@pytest.fixture(scope="session")
+def name_age_columns():
+    """
+    Read-only "Name" and "Age" column definitions with default options.
 
-        Asserts:
-            - The `Table` object is created with the specified custom title.
-        """
+    Returns:
+        tuple: Two read-only column definition mappings.
+    """
+    return (
+        MappingProxyType({"header": "Name", "key": "name"}),
+        MappingProxyType({"header": "Age", "key": "age"}),
+    )
 
-        data = [{"name": "Alice", "age": 30}]
-        columns = [{"header": "Name", "key": "name"}, {"header": "Age", "key": "age"}]
-        custom_title = "Custom Table Title"
 
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
+@pytest.fixture(scope="class")
+def shared_table_mock():
+    """
+    One `Table` stand-in shared by every test in a class.
 
-            rich_display_table(data, title=custom_title, columns=columns)
+    Returns:
+        Mock: The shared mock; `mock_table` resets it before each test.
+    """
+    return Mock()
 
-            # Verify Table was created with the custom title
-            mock_table.assert_called_once_with(title=custom_title)
 
-    # Display a table with custom column styles
-    def test_display_table_with_custom_column_styles(self):
-        """
-        Test that the function applies custom styles to columns.
+class TestRichDisplayTable:
+    """
+    Test suite for the `rich_display_table` function.
+    """
 
-        Asserts:
-            - The `add_column` method is called with the correct styles for each column.
+    @pytest.fixture
+    def mock_table(self, shared_table_mock):
         """
+        Patch `Table` in `rich_printer` with the shared mock for the duration of a test.
 
-        data = [{"name": "Alice", "age": 30}]
-        columns = [
-            {"header": "Name", "key": "name", "style": "bold red"},
-            {"header": "Age", "key": "age", "style": "blue"},
-        ]
-
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
+        The mock is reset first, so each test only sees its own calls. Not autouse, so
+        `test_display_table_with_valid_data` still renders a real table.
 
-            rich_display_table(data, columns=columns)
+        Args:
+            shared_table_mock: Fixture providing the class-scoped `Table` mock.
 
-            # Verify add_column was called with the correct styles
-            mock_table_instance.add_column.assert_any_call(
-                "Name", justify="left", style="bold red", no_wrap=False
-            )
-            mock_table_instance.add_column.assert_any_call(
-                "Age", justify="left", style="blue", no_wrap=False
-            )
+        Yields:
+            Mock: The patched `Table` class; `return_value` is the table instance.
+        """
+        # Plain Mock: only add_column/add_row are used, so MagicMock's dunder set is not needed
+        shared_table_mock.reset_mock()
+        with patch("api_client.helpers.rich_printer.Table", new=shared_table_mock):
+            yield shared_table_mock
 
-    # Display a table with different column justifications
-    def test_display_table_with_different_justifications(self):
+    # Display a table with valid data and column definitions
+    def test_display_table_with_valid_data(self, alice_bob_data, name_age_columns):
         """
-        Test that the function supports different column justifications.
+        Test that the function displays a table with valid data and column definitions.
+
+        Args:
+            alice_bob_data: Fixture providing read-only rows for Alice and Bob.
+            name_age_columns: Fixture providing read-only "Name" and "Age" column definitions.
 
         Asserts:
-            - The `add_column` method is called with the correct justification for each column.
+            - The function does not raise any exceptions when displaying valid data.
         """
 
-        data = [{"name": "Alice", "age": 30}]
-        columns = [
-            {"header": "Name", "key": "name", "justify": "left"},
-            {"header": "Age", "key": "age", "justify": "right"},
-            {"header": "Status", "key": "status", "justify": "center"},
-        ]
+        # Since the function prints to console, we're testing it doesn't raise exceptions
+        rich_display_table(alice_bob_data, title="Test Table", columns=name_age_columns)
+        # If we reach here without exception, the test passes
 
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
-
-            rich_display_table(data, columns=columns)
-
-            # Verify add_column was called with the correct justifications
-            mock_table_instance.add_column.assert_any_call(
-                "Name", justify="left", style=None, no_wrap=False
-            )
-            mock_table_instance.add_column.assert_any_call(
-                "Age", justify="right", style=None, no_wrap=False
-            )
-            mock_table_instance.add_column.assert_any_call(
-                "Status", justify="center", style=None, no_wrap=False
-            )
-
-    # Display a table with no_wrap option for specific columns
-    def test_display_table_with_no_wrap_option(self):
+    # Display a table with a custom title
+    def test_display_table_with_custom_title(
+        self, alice_data, name_age_columns, mock_table
+    ):
         """
-        Test that the function handles the `no_wrap` option for specific columns.
+        Test that the function supports custom table titles.
+
+        Args:
+            alice_data: Fixture providing a read-only row for Alice.
+            name_age_columns: Fixture providing read-only "Name" and "Age" column definitions.
+            mock_table: Fixture patching `Table` in `rich_printer`.
 
         Asserts:
-            - The `add_column` method is called with the correct `no_wrap` setting for each column.
+            - The `Table` object is created with the specified custom title.
         """
 
-        data = [{"name": "Alice with a very long name", "age": 30}]
-        columns = [
-            {"header": "Name", "key": "name", "no_wrap": True},
-            {"header": "Age", "key": "age", "no_wrap": False},
-        ]
+        custom_title = "Custom Table Title"
+
+        rich_display_table(alice_data, title=custom_title, columns=name_age_columns)
+
+        # Verify Table was created with the custom title
+        mock_table.assert_called_once_with(title=custom_title)
+
+    # Pass per-column style, justify and no_wrap options through to add_column
+    @pytest.mark.parametrize(
+        "columns,expected_calls",
+        [
+            pytest.param(
+                [
+                    {"header": "Name", "key": "name", "style": "bold red"},
+                    {"header": "Age", "key": "age", "style": "blue"},
+                ],
+                [
+                    call("Name", justify="left", style="bold red", no_wrap=False),
+                    call("Age", justify="left", style="blue", no_wrap=False),
+                ],
+                id="custom_column_styles",
+            ),
+            pytest.param(
+                [
+                    {"header": "Name", "key": "name", "justify": "left"},
+                    {"header": "Age", "key": "age", "justify": "right"},
+                    {"header": "Status", "key": "status", "justify": "center"},
+                ],
+                [
+                    call("Name", justify="left", style=None, no_wrap=False),
+                    call("Age", justify="right", style=None, no_wrap=False),
+                    call("Status", justify="center", style=None, no_wrap=False),
+                ],
+                id="different_justifications",
+            ),
+            pytest.param(
+                [
+                    {"header": "Name", "key": "name", "no_wrap": True},
+                    {"header": "Age", "key": "age", "no_wrap": False},
+                ],
+                [
+                    call("Name", justify="left", style=None, no_wrap=True),
+                    call("Age", justify="left", style=None, no_wrap=False),
+                ],
+                id="no_wrap_option",
+            ),
+        ],
+    )
+    def test_display_table_with_column_options(
+        self, mock_table, columns, expected_calls
+    ):
+        """
+        Test that the function passes each column's style, justification and `no_wrap`
+        setting to `add_column`, filling in defaults for options that are not set.
 
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
+        Args:
+            mock_table: Fixture patching `Table` in `rich_printer`.
+            columns (list): The column definitions to display.
+            expected_calls (list): The expected `add_column` calls, in column order.
 
-            rich_display_table(data, columns=columns)
+        Asserts:
+            - The `add_column` method is called with the correct options for each column.
+        """
 
-            # Verify add_column was called with the correct no_wrap settings
-            mock_table_instance.add_column.assert_any_call(
-                "Name", justify="left", style=None, no_wrap=True
-            )
-            mock_table_instance.add_column.assert_any_call(
-                "Age", justify="left", style=None, no_wrap=False
-            )
+        # No rows: only the add_column calls are under test
+        rich_display_table([], columns=columns)
+
+        # Verify add_column was called with the correct options for each column
+        mock_table.return_value.add_column.assert_has_calls(expected_calls)
 
     # Raise ValueError when columns parameter is None
-    def test_raise_value_error_when_columns_is_none(self):
+    def test_raise_value_error_when_columns_is_none(self, alice_data):
         """
         Test that the function raises a `ValueError` when the `columns` parameter is `None`.
 
+        Args:
+            alice_data: Fixture providing a read-only row for Alice.
+
         Asserts:
             - A `ValueError` is raised with the correct error message.
         """
-        data = [{"name": "Alice", "age": 30}]
-
         with pytest.raises(ValueError) as excinfo:
-            rich_display_table(data, columns=None)
+            rich_display_table(alice_data, columns=None)
 
         assert "Columns must be defined to display the table." in str(excinfo.value)
 
     # Handle empty data list (no rows)
-    def test_handle_empty_data_list(self):
+    def test_handle_empty_data_list(self, name_age_columns, mock_table):
         """
         Test that the function handles empty data lists correctly.
 
+        Args:
+            name_age_columns: Fixture providing read-only "Name" and "Age" column definitions.
+            mock_table: Fixture patching `Table` in `rich_printer`.
+
         Asserts:
             - Columns are added to the table, but no rows are added.
         """
 
         data = []
-        columns = [{"header": "Name", "key": "name"}, {"header": "Age", "key": "age"}]
 
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
+        rich_display_table(data, columns=name_age_columns)
 
-            rich_display_table(data, columns=columns)
-
-            # Verify columns were added but no rows
-            assert mock_table_instance.add_column.call_count == 2
-            assert mock_table_instance.add_row.call_count == 0
+        # Verify columns were added but no rows
+        assert mock_table.return_value.add_column.call_count == 2
+        assert mock_table.return_value.add_row.call_count == 0
 
     # Handle empty columns list
     # TODO: fix this test
@@ -228,10 +280,14 @@ class TestRichDisplayTable:
     #         assert mock_table_instance.add_row.call_count == 0
 
     # Process data with missing keys specified in columns
-    def test_process_data_with_missing_keys(self):
+    def test_process_data_with_missing_keys(self, name_age_columns, mock_table):
         """
         Test that the function handles missing keys in the data by displaying "N/A".
 
+        Args:
+            name_age_columns: Fixture providing read-only "Name" and "Age" column definitions.
+            mock_table: Fixture patching `Table` in `rich_printer`.
+
         Asserts:
             - Rows are added with "N/A" for missing keys.
         """
@@ -240,23 +296,21 @@ class TestRichDisplayTable:
             {"name": "Alice"},  # Missing 'age' key
             {"age": 25},  # Missing 'name' key
         ]
-        columns = [{"header": "Name", "key": "name"}, {"header": "Age", "key": "age"}]
 
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
+        rich_display_table(data, columns=name_age_columns)
 
-            rich_display_table(data, columns=columns)
-
-            # Verify rows were added with 'N/A' for missing values
-            mock_table_instance.add_row.assert_any_call("Alice", "N/A")
-            mock_table_instance.add_row.assert_any_call("N/A", "25")
+        # Verify rows were added with 'N/A' for missing values
+        mock_table.return_value.add_row.assert_any_call("Alice", "N/A")
+        mock_table.return_value.add_row.assert_any_call("N/A", "25")
 
     # Handle non-string values in data by converting to string
-    def test_handle_non_string_values(self):
+    def test_handle_non_string_values(self, mock_table):
         """
         Test that the function converts non-string values to strings before displaying them.
 
+        Args:
+            mock_table: Fixture patching `Table` in `rich_printer`.
+
         Asserts:
             - All values in the table rows are converted to strings.
         """
@@ -278,13 +332,9 @@ class TestRichDisplayTable:
             {"header": "Items", "key": "items"},
         ]
 
-        with patch("api_client.helpers.rich_printer.Table") as mock_table:
-            mock_table_instance = MagicMock()
-            mock_table.return_value = mock_table_instance
-
-            rich_display_table(data, columns=columns)
+        rich_display_table(data, columns=columns)
 
-            # Verify all values were converted to strings
-            mock_table_instance.add_row.assert_called_once_with(
-                "Alice", "30", "True", "95.5", "[1, 2, 3]"
-            )
+        # Verify all values were converted to strings
+        mock_table.return_value.add_row.assert_called_once_with(
+            "Alice", "30", "True", "95.5", "[1, 2, 3]"
+        )
@@ -9,12 +9,16 @@ The tests in this module ensure that:
 - The function successfully writes batch records to the specified file.
 - The function creates a new file if it does not exist.
 - The function overwrites existing file content if the file already exists.
-- The function properly formats JSON with indentation for readability.
+- The function properly formats JSON with indentation for readability, or compactly when `indent` is None.
 - The function handles edge cases such as empty batch records, invalid file paths, and permission errors.
 - The function handles large datasets and non-serializable objects gracefully.
 
+Every test runs on the in-memory fake file system provided by the pyfakefs `fs` fixture, so
+no real files are created.
+
 Dependencies:
 - pytest: For test execution and assertions.
+- pyfakefs: For the `fs` fixture that replaces real disk I/O with an in-memory file system.
 - api_client.helpers.general.write_batch_file: The function under test.
 
 Test Cases:
@@ -22,12 +26,14 @@ Test Cases:
 - `test_creates_new_file_if_not_exists`: Ensures the function creates a new file if it does not exist.
 - `test_overwrites_existing_file_content`: Verifies that the function overwrites existing file content if the file already exists.
 - `test_formats_json_with_proper_indentation`: Ensures the function properly formats JSON with indentation for readability.
-- `test_handles_lists_of_different_sizes`: Verifies that the function handles lists of different sizes correctly.
+- `test_writes_compact_json_when_indent_is_none`: Verifies that the function writes compact JSON when `indent` is None.
+- `test_handles_lists_of_different_sizes`: Parametrized over 1, 10 and 100 records; verifies that the function handles lists of different sizes correctly.
 - `test_handles_empty_batch_records`: Ensures the function handles empty batch records correctly by writing an empty list to the file.
 - `test_handles_nonexistent_directory`: Verifies that the function raises a `FileNotFoundError` for invalid file paths.
 - `test_handles_permission_errors`: Ensures the function raises a `PermissionError` when writing to a file in a read-only directory.
 - `test_handles_non_serializable_objects`: Verifies that the function raises a `TypeError` when batch records contain non-serializable objects.
-- `test_handles_large_batch_records`: Ensures the function handles very large batch records without memory issues.
+- `test_handles_large_batch_records`: Ensures the function handles very large batch records without memory issues
+  (marked `slow`; run with `--runslow`).
 """
 
 import json
@@ -35,9 +41,15 @@ import os
 import stat
 
 import pytest
+from pyfakefs.fake_filesystem import OSType
+from pyfakefs.helpers import reset_ids, set_uid
 
 from api_client.helpers.general import write_batch_file
 
+# The common single-record batch, and its compact JSON as written with indent=None
+_SMALL_RECORDS = [{"id": 1, "name": "Test Record"}]
+_SMALL_RECORDS_JSON = json.dumps(_SMALL_RECORDS).encode()
+
 
 class TestWriteBatchFile:
     """
@@ -45,64 +57,63 @@ class TestWriteBatchFile:
     """
 
     # Successfully writes batch records to the specified filepath
-    def test_writes_batch_records_to_file(self):
+    def test_writes_batch_records_to_file(self, fs):
         """
         Test that the function successfully writes batch records to the specified file.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - The file is created and contains the expected batch records.
         """
         # Arrange
-        filepath = "test_batch.json"
-        batch_records = [{"id": 1, "name": "Test Record"}]
+        filepath = "/test_batch.json"
+        batch_records = _SMALL_RECORDS
 
         # Act
-        write_batch_file(filepath, batch_records)
+        write_batch_file(filepath, batch_records, indent=None)
 
         # Assert
         assert os.path.exists(filepath)
-        with open(filepath, "r", encoding="utf-8") as file:
-            content = json.load(file)
-        assert content == batch_records
-
-        # Cleanup
-        os.remove(filepath)
+        with open(filepath, "rb") as file:
+            content = file.read()
+        assert content == _SMALL_RECORDS_JSON
 
     # Creates a new file if it doesn't exist
-    def test_creates_new_file_if_not_exists(self):
+    def test_creates_new_file_if_not_exists(self, fs):
         """
         Test that the function creates a new file if it does not exist.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - The file is created and contains the expected batch records.
         """
         # Arrange
-        filepath = "new_test_batch.json"
-        batch_records = [{"id": 1, "name": "Test Record"}]
-
-        # Ensure file doesn't exist
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        filepath = "/new_test_batch.json"
+        batch_records = _SMALL_RECORDS
 
         # Act
-        write_batch_file(filepath, batch_records)
+        write_batch_file(filepath, batch_records, indent=None)
 
         # Assert
         assert os.path.exists(filepath)
 
-        # Cleanup
-        os.remove(filepath)
-
     # Overwrites existing file content if the file already exists
-    def test_overwrites_existing_file_content(self):
+    def test_overwrites_existing_file_content(self, fs):
         """
         Test that the function overwrites existing file content if the file already exists.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - The file content is replaced with the new batch records.
         """
         # Arrange
-        filepath = "existing_test_batch.json"
+        filepath = "/existing_test_batch.json"
         initial_records = [{"id": 1, "name": "Initial Record"}]
         new_records = [{"id": 2, "name": "New Record"}]
 
@@ -111,156 +122,174 @@ class TestWriteBatchFile:
             json.dump(initial_records, file)
 
         # Act
-        write_batch_file(filepath, new_records)
+        write_batch_file(filepath, new_records, indent=None)
 
         # Assert
-        with open(filepath, "r", encoding="utf-8") as file:
-            content = json.load(file)
-        assert content == new_records
-        assert content != initial_records
-
-        # Cleanup
-        os.remove(filepath)
+        with open(filepath, "rb") as file:
+            content = file.read()
+        assert content == json.dumps(new_records).encode()
+        assert content != json.dumps(initial_records).encode()
 
     # Properly formats JSON with indent=4 for readability
-    def test_formats_json_with_proper_indentation(self):
+    def test_formats_json_with_proper_indentation(self, fs):
         """
         Test that the function properly formats JSON with indentation for readability.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - The JSON file contains properly indented content.
         """
         # Arrange
-        filepath = "indented_test_batch.json"
+        filepath = "/indented_test_batch.json"
         batch_records = [{"id": 1, "name": "Test Record", "nested": {"key": "value"}}]
 
         # Act
         write_batch_file(filepath, batch_records)
 
         # Assert
-        with open(filepath, "r", encoding="utf-8") as file:
+        with open(filepath, "rb") as file:
             content = file.read()
 
-        # Check for indentation (4 spaces)
-        assert '    "id": 1' in content
-        assert '        "key": "value"' in content
+        # Check for indentation (4 spaces); ASCII-only, so compare raw bytes
+        assert b'    "id": 1' in content
+        assert b'        "key": "value"' in content
+
+    # Writes compact JSON when indent is None
+    def test_writes_compact_json_when_indent_is_none(self, fs):
+        """
+        Test that the function writes compact JSON when `indent` is None.
+
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
+        Asserts:
+            - The JSON file is written on a single line without indentation.
+        """
+        # Arrange
+        filepath = "/compact_test_batch.json"
+        batch_records = [{"id": 1, "nested": {"key": "value"}}]
+
+        # Act
+        write_batch_file(filepath, batch_records, indent=None)
 
-        # Cleanup
-        os.remove(filepath)
+        # Assert
+        with open(filepath, "r", encoding="utf-8") as file:
+            content = file.read()
+        assert content == '[{"id": 1, "nested": {"key": "value"}}]'
 
     # Handles lists of different sizes correctly
-    def test_handles_lists_of_different_sizes(self):
+    @pytest.mark.parametrize("size", [1, 10, 100])
+    def test_handles_lists_of_different_sizes(self, fs, size):
         """
         Test that the function handles lists of different sizes correctly.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+            size (int): The number of batch records to write.
+
         Asserts:
-            - The file contains the expected number of batch records for each test case.
+            - The file contains the expected number of batch records.
         """
         # Arrange
-        filepath = "varying_size_test_batch.json"
-
-        # Test with different list sizes
-        test_cases = [
-            [{"id": i} for i in range(1)],
-            [{"id": i} for i in range(10)],
-            [{"id": i} for i in range(100)],
-        ]
-
-        for batch_records in test_cases:
-            # Act
-            write_batch_file(filepath, batch_records)
+        filepath = "/varying_size_test_batch.json"
+        batch_records = [{"id": i} for i in range(size)]
 
-            # Assert
-            with open(filepath, "r", encoding="utf-8") as file:
-                content = json.load(file)
-            assert content == batch_records
-            assert len(content) == len(batch_records)
+        # Act
+        write_batch_file(filepath, batch_records, indent=None)
 
-        # Cleanup
-        os.remove(filepath)
+        # Assert
+        with open(filepath, "rb") as file:
+            content = file.read()
+        assert content == json.dumps(batch_records).encode()
 
     # Handles empty batch_records list
-    def test_handles_empty_batch_records(self):
+    def test_handles_empty_batch_records(self, fs):
         """
         Test that the function handles empty batch records correctly by writing an empty list to the file.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - The file contains an empty list.
         """
         # Arrange
-        filepath = "empty_test_batch.json"
+        filepath = "/empty_test_batch.json"
         batch_records = []
 
         # Act
-        write_batch_file(filepath, batch_records)
+        write_batch_file(filepath, batch_records, indent=None)
 
         # Assert
-        with open(filepath, "r", encoding="utf-8") as file:
-            content = json.load(file)
-        assert content == []
-        assert isinstance(content, list)
-        assert len(content) == 0
-
-        # Cleanup
-        os.remove(filepath)
+        with open(filepath, "rb") as file:
+            content = file.read()
+        assert content == b"[]"
 
     # Handles invalid filepath (non-existent directory)
-    def test_handles_nonexistent_directory(self):
+    def test_handles_nonexistent_directory(self, fs):
         """
         Test that the function raises a `FileNotFoundError` for invalid file paths.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - A `FileNotFoundError` is raised with the correct error message.
         """
         # Arrange
-        filepath = "nonexistent_dir/test_batch.json"
-        batch_records = [{"id": 1, "name": "Test Record"}]
+        filepath = "/nonexistent_dir/test_batch.json"
+        batch_records = _SMALL_RECORDS
 
         # Act & Assert
         with pytest.raises(FileNotFoundError):
             write_batch_file(filepath, batch_records)
 
     # Handles permission errors when writing to file
-    def test_handles_permission_errors(self):
+    def test_handles_permission_errors(self, fs):
         """
         Test that the function raises a `PermissionError` when writing to a file in a read-only directory.
 
+        The fake file system emulates Linux and a non-root user, so the read-only directory is
+        enforced on every platform and when the suite itself runs as root.
+
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - A `PermissionError` is raised with the correct error message.
         """
         # Arrange
+        fs.os = OSType.LINUX
+        set_uid(1000)
         # Create a directory with no write permissions
-        read_only_dir = "read_only_dir"
-        if not os.path.exists(read_only_dir):
-            os.makedirs(read_only_dir)
+        read_only_dir = "/read_only_dir"
+        fs.create_dir(read_only_dir, perm_bits=stat.S_IRUSR | stat.S_IXUSR)
 
         filepath = os.path.join(read_only_dir, "test_batch.json")
-        batch_records = [{"id": 1, "name": "Test Record"}]
-
-        # Make directory read-only on Unix systems
-        if os.name != "nt":  # Skip on Windows
-            os.chmod(read_only_dir, stat.S_IRUSR | stat.S_IXUSR)
+        batch_records = _SMALL_RECORDS
 
-            # Act & Assert
+        # Act & Assert
+        try:
             with pytest.raises(PermissionError):
                 write_batch_file(filepath, batch_records)
-
-            # Cleanup - restore permissions for cleanup
-            os.chmod(read_only_dir, stat.S_IRWXU)
-
-        # Cleanup
-        os.rmdir(read_only_dir)
+        finally:
+            reset_ids()
 
     # Handles non-serializable objects in batch_records
-    def test_handles_non_serializable_objects(self):
+    def test_handles_non_serializable_objects(self, fs):
         """
         Test that the function raises a `TypeError` when batch records contain non-serializable objects.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+
         Asserts:
             - A `TypeError` is raised with the correct error message.
         """
         # Arrange
-        filepath = "non_serializable_test_batch.json"
+        filepath = "/non_serializable_test_batch.json"
 
         # Create a non-serializable object (a function)
         def sample_function():
@@ -272,32 +301,24 @@ class TestWriteBatchFile:
         with pytest.raises(TypeError):
             write_batch_file(filepath, batch_records)
 
-        # Verify file wasn't created or was empty
-        if os.path.exists(filepath):
-            os.remove(filepath)
-
     # Handles very large batch_records that may cause memory issues
-    def test_handles_large_batch_records(self):
+    @pytest.mark.slow
+    def test_handles_large_batch_records(self, fs, large_batch_records):
         """
         Test that the function handles very large batch records without memory issues.
 
+        Args:
+            fs: The pyfakefs fixture providing an in-memory fake file system.
+            large_batch_records: Fixture providing a shared 1,000-record batch with nested data.
+
         Asserts:
             - The file is created and contains all expected batch records.
             - The file size is greater than a specified threshold.
         """
         # Arrange
-        filepath = "large_test_batch.json"
-
-        # Create a relatively large dataset (not too large for test purposes)
-        # 10,000 records with some nested data
-        batch_records = [
-            {
-                "id": i,
-                "data": "x" * 100,  # 100 character string
-                "nested": {"values": list(range(20))},
-            }
-            for i in range(10000)
-        ]
+        filepath = "/large_test_batch.json"
+
+        batch_records = list(large_batch_records)
 
         # Act
         write_batch_file(filepath, batch_records)
@@ -305,14 +326,11 @@ class TestWriteBatchFile:
         # Assert
         assert os.path.exists(filepath)
         file_size = os.path.getsize(filepath)
-        assert file_size > 5000000  # Should be several MB
+        assert file_size > 500_000  # Should be over half a MB
 
         # Verify data integrity by checking a few random elements
         with open(filepath, "r", encoding="utf-8") as file:
             content = json.load(file)
-        assert len(content) == 10000
+        assert len(content) == 1000
         assert content[0]["id"] == 0
-        assert content[9999]["id"] == 9999
-
-        # Cleanup
-        os.remove(filepath)
+        assert content[999]["id"] == 999
@@ -12,8 +12,13 @@ The tests in this module ensure that:
 - The function appends content to existing files when using append mode.
 - The function handles edge cases such as empty strings, large strings, non-existent directories, and permission errors.
 
+Every test writes into pytest's per-test `tmp_path` directory, which pytest removes afterwards,
+so no files are left in the working directory and the module is safe to run with `pytest -n auto`.
+
 Dependencies:
 - pytest: For test execution and assertions.
+- hashlib: For checking the content of large files by digest.
+- pytest-mock: For spying on `os.write` and shrinking the write slice size.
 - api_client.helpers.general.write_string_2file: The function under test.
 
 Test Cases:
@@ -24,17 +29,24 @@ Test Cases:
 - `test_appends_to_existing_content`: Verifies that the function appends content to existing files in append mode.
 - `test_write_empty_string`: Ensures the function handles empty strings correctly.
 - `test_write_large_string`: Verifies that the function handles very large strings without issues.
+- `test_append_large_non_ascii_string`: Ensures the function appends very large multi-byte strings as UTF-8.
+- `test_write_large_string_in_slices`: Verifies that very large strings are encoded and written one slice at a time.
 - `test_filepath_with_nonexistent_directories`: Ensures the function raises a `FileNotFoundError` for non-existent directories.
 - `test_file_permission_issues`: Verifies that the function raises a `PermissionError` when writing to a file in a read-only directory.
 """
 
+import hashlib
 import os
-import shutil
 
 import pytest
 
 from api_client.helpers.general import write_string_2file
 
+# SHA-256 of "A" * 1_000_000, the content written by test_write_large_string
+_LARGE_CONTENT_SHA256 = (
+    "e23c0cda5bcdecddec446b54439995c7260c8cdcf2953eec9f5cdb6948e5898d"
+)
+
 
 class TestWriteString2file:
     """
@@ -42,15 +54,18 @@ class TestWriteString2file:
     """
 
     # Successfully writes a string to a file in write mode
-    def test_write_string_to_file_in_write_mode(self):
+    def test_write_string_to_file_in_write_mode(self, tmp_path):
         """
         Test that the function writes a string to a file in write mode.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - The file is created and contains the expected content.
         """
         # Arrange
-        test_file = "test_write.txt"
+        test_file = tmp_path / "test_write.txt"
         test_content = "Hello, World!"
 
         # Act
@@ -61,19 +76,19 @@ class TestWriteString2file:
             content = file.read()
         assert content == test_content
 
-        # Cleanup
-        os.remove(test_file)
-
     # Successfully writes a string to a file in append mode
-    def test_write_string_to_file_in_append_mode(self):
+    def test_write_string_to_file_in_append_mode(self, tmp_path):
         """
         Test that the function appends content to a file in append mode.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - The file contains the initial content followed by the appended content.
         """
         # Arrange
-        test_file = "test_append.txt"
+        test_file = tmp_path / "test_append.txt"
         initial_content = "Initial content\n"
         append_content = "Appended content"
 
@@ -89,25 +104,21 @@ class TestWriteString2file:
             content = file.read()
         assert content == initial_content + append_content
 
-        # Cleanup
-        os.remove(test_file)
-
     # Creates a new file if it doesn't exist
-    def test_creates_new_file_if_not_exists(self):
+    def test_creates_new_file_if_not_exists(self, tmp_path):
         """
         Test that the function creates a new file if it does not exist.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - The file is created and contains the expected content.
         """
         # Arrange
-        test_file = "new_test_file.txt"
+        test_file = tmp_path / "new_test_file.txt"
         test_content = "Content in new file"
 
-        # Ensure file doesn't exist
-        if os.path.exists(test_file):
-            os.remove(test_file)
-
         # Act
         write_string_2file(test_file, test_content)
 
@@ -117,19 +128,19 @@ class TestWriteString2file:
             content = file.read()
         assert content == test_content
 
-        # Cleanup
-        os.remove(test_file)
-
     # Overwrites existing file content when using write mode
-    def test_overwrites_existing_content_in_write_mode(self):
+    def test_overwrites_existing_content_in_write_mode(self, tmp_path):
         """
         Test that the function overwrites existing file content when using write mode.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - The file content is replaced with the new content.
         """
         # Arrange
-        test_file = "test_overwrite.txt"
+        test_file = tmp_path / "test_overwrite.txt"
         initial_content = "Initial content that should be overwritten"
         new_content = "New content"
 
@@ -146,19 +157,19 @@ class TestWriteString2file:
         assert content == new_content
         assert content != initial_content
 
-        # Cleanup
-        os.remove(test_file)
-
     # Appends content to existing file when using append mode
-    def test_appends_to_existing_content(self):
+    def test_appends_to_existing_content(self, tmp_path):
         """
         Test that the function appends content to an existing file when using append mode.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - The file contains the initial content followed by the appended content.
         """
         # Arrange
-        test_file = "test_append_existing.txt"
+        test_file = tmp_path / "test_append_existing.txt"
         initial_content = "First line\n"
         second_content = "Second line\n"
         third_content = "Third line"
@@ -176,19 +187,19 @@ class TestWriteString2file:
             content = file.read()
         assert content == initial_content + second_content + third_content
 
-        # Cleanup
-        os.remove(test_file)
-
     # Handling empty string as filetext
-    def test_write_empty_string(self):
+    def test_write_empty_string(self, tmp_path):
         """
         Test that the function handles empty strings correctly.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - The file is created and contains an empty string.
         """
         # Arrange
-        test_file = "test_empty.txt"
+        test_file = tmp_path / "test_empty.txt"
         empty_content = ""
 
         # Act
@@ -201,63 +212,112 @@ class TestWriteString2file:
         assert content == empty_content
         assert len(content) == 0
 
-        # Cleanup
-        os.remove(test_file)
-
     # Handling very large strings
-    def test_write_large_string(self):
+    def test_write_large_string(self, tmp_path):
         """
         Test that the function handles very large strings without issues.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
-            - The file contains the expected large string.
+            - The file has the expected size and SHA-256 digest.
         """
         # Arrange
-        test_file = "test_large.txt"
+        test_file = tmp_path / "test_large.txt"
         large_content = "A" * 1000000  # 1MB of data
 
         # Act
         write_string_2file(test_file, large_content)
 
         # Assert
+        assert test_file.stat().st_size == 1_000_000
+        assert (
+            hashlib.sha256(test_file.read_bytes()).hexdigest() == _LARGE_CONTENT_SHA256
+        )
+
+    # Appending a very large non-ASCII string
+    def test_append_large_non_ascii_string(self, tmp_path):
+        """
+        Test that a very large string with multi-byte characters is appended as UTF-8.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
+        Asserts:
+            - The file contains the initial content followed by the large string.
+        """
+        # Arrange
+        test_file = tmp_path / "test_large_append.txt"
+        initial_content = "Initial content\n"
+        large_content = "é猫" * 100000  # 200,000 characters, 500,000 bytes
+
+        with open(test_file, "w", encoding="utf-8") as file:
+            file.write(initial_content)
+
+        # Act
+        write_string_2file(test_file, large_content, mode="a")
+
+        # Assert
+        with open(test_file, "r", encoding="utf-8") as file:
+            content = file.read()
+        assert content == initial_content + large_content
+
+    # Writing a very large string in several encoded slices
+    def test_write_large_string_in_slices(self, tmp_path, mocker):
+        """
+        Test that a very large string is encoded and written one slice at a time.
+
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+            mocker: The pytest-mock fixture for mocking dependencies.
+
+        Asserts:
+            - `os.write` is called once per slice.
+            - The file contains the complete string.
+        """
+        # Arrange
+        mocker.patch("api_client.helpers.general.LARGE_WRITE_CHUNK_CHARS", 100000)
+        write_spy = mocker.spy(os, "write")
+        test_file = tmp_path / "test_large_slices.txt"
+        large_content = "猫" * 250000  # three slices of at most 100,000 characters
+
+        # Act
+        write_string_2file(test_file, large_content)
+
+        # Assert
+        assert write_spy.call_count == 3
         with open(test_file, "r", encoding="utf-8") as file:
             content = file.read()
         assert content == large_content
-        assert len(content) == 1000000
-
-        # Cleanup
-        os.remove(test_file)
 
     # Handling filepath with directories that don't exist
-    def test_filepath_with_nonexistent_directories(self):
+    def test_filepath_with_nonexistent_directories(self, tmp_path):
         """
         Test that the function raises a `FileNotFoundError` for non-existent directories.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - A `FileNotFoundError` is raised with the correct error message.
         """
         # Arrange
-        test_dir = "nonexistent_dir"
-        test_file = os.path.join(test_dir, "test_file.txt")
+        test_file = tmp_path / "nonexistent_dir" / "test_file.txt"
         test_content = "Content in nested file"
 
-        # Ensure directory doesn't exist
-        if os.path.exists(test_dir):
-            shutil.rmtree(test_dir)
-
         # Act & Assert
         with pytest.raises(FileNotFoundError):
             write_string_2file(test_file, test_content)
 
-        # Cleanup
-        if os.path.exists(test_dir):
-            shutil.rmtree(test_dir)
-
     # Handling file permission issues
-    def test_file_permission_issues(self):
+    def test_file_permission_issues(self, tmp_path):
         """
         Test that the function raises a `PermissionError` when writing to a file in a read-only directory.
 
+        Args:
+            tmp_path: The pytest fixture for creating temporary file paths.
+
         Asserts:
             - A `PermissionError` is raised with the correct error message.
         """
@@ -266,7 +326,7 @@ class TestWriteString2file:
             pytest.skip("Skipping permission test on Windows")
 
         # Arrange
-        test_file = "test_permission.txt"
+        test_file = tmp_path / "test_permission.txt"
         test_content = "Test content"
 
         # Create file and remove write permissions
@@ -275,9 +335,9 @@ class TestWriteString2file:
         os.chmod(test_file, 0o444)  # Read-only
 
         # Act & Assert
-        with pytest.raises(PermissionError):
-            write_string_2file(test_file, test_content)
-
-        # Cleanup - restore permissions to delete
-        os.chmod(test_file, 0o666)
-        os.remove(test_file)
+        try:
+            with pytest.raises(PermissionError):
+                write_string_2file(test_file, test_content)
+        finally:
+            # Restore permissions so pytest can remove tmp_path
+            os.chmod(test_file, 0o666)
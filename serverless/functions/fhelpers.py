@@ -7,6 +7,8 @@ S3 buckets, extracting metadata from S3 keys, converting data to JSON, and handl
 Rekognition responses.
 
 Functions:
+    - check_required_env_vars(env_var_names): Checks that the required environment variables are set.
+    - get_int_env_var(name): Reads an environment variable as an integer.
     - validate_s3bucket(s3_client): Validates the existence of S3 buckets specified in environment variables.
     - get_s3_key_from_event(event): Extracts the S3 key from an S3 event.
     - convert_time_string_to_epoch(time_string, format_string): Converts a time string to epoch time.
@@ -25,6 +27,8 @@ Environment Variables:
     - s3bucketSource: The name of the source S3 bucket.
     - s3bucketDest: The name of the destination S3 bucket.
     - s3bucketFail: The name of the failure S3 bucket.
+    - FORCE_REVALIDATE_BUCKETS (optional): Set to "1" to check the S3 buckets on every
+      invocation instead of once per container.
 
 Usage:
     This module is used in AWS Lambda functions to process S3 events, extract metadata,
@@ -45,38 +49,122 @@ Example:
     item_dict2 = gen_item_dict2_from_rek_resp(rekog_results)
 
 Error Handling:
-    - Logs critical errors and exits the program if required environment variables are unset
-      or S3 buckets do not exist.
+    - Raises `RuntimeError` at import if required environment variables are unset, or if
+      dynamoDBTTL is not an integer, so the Lambda fails its INIT phase.
+    - Raises if the S3 buckets do not exist.
     - Handles serialization errors when converting data to JSON.
     - Logs and raises exceptions for invalid S3 keys or Rekognition responses.
 
 """
 
-import sys
-
-sys.path.insert(0, "modules")
+import calendar
+import functools
 import json
 import logging
 import os
+import re
+import sys
+import time
 from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
-import pytz
 from functions.global_context import global_context
 
 from shared_helpers.boto3_helpers import check_bucket_exists, safeget
 
 LOG = logging.getLogger()
 
-dyndb_ttl = os.getenv("dynamoDBTTL")
+# Checked at import so a misconfigured Lambda fails its INIT phase instead of serving
+# partially working invocations
+REQUIRED_ENV_VARS = ("dynamoDBTTL", "s3bucketSource", "s3bucketDest", "s3bucketFail")
+
+
+def check_required_env_vars(env_var_names=REQUIRED_ENV_VARS):
+    """
+    Check that the required environment variables are set.
+
+    Args:
+        env_var_names (tuple, optional): The names of the environment variables to check.
+            Defaults to `REQUIRED_ENV_VARS`.
+
+    Raises:
+        RuntimeError: If any of the environment variables are unset or empty.
+    """
+    missing = [name for name in env_var_names if not os.getenv(name)]
+    if missing:
+        LOG.critical("Required env vars are unset: <%s>", missing)
+        raise RuntimeError(f"Required env vars are unset: {missing}")
+
+
+def get_int_env_var(name):
+    """
+    Read an environment variable as an integer.
+
+    Args:
+        name (str): The name of the environment variable.
+
+    Returns:
+        int: The value of the environment variable.
+
+    Raises:
+        RuntimeError: If the environment variable is not an integer.
+    """
+    value = os.getenv(name)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        LOG.critical("Env var <%s> is not an integer: <%s>", name, value)
+        raise RuntimeError(f"Env var {name} is not an integer: {value!r}") from None
+
+
+check_required_env_vars()
+
+# Read once at cold start rather than per invocation or per item written to DynamoDB
+dyndb_ttl = get_int_env_var("dynamoDBTTL")
+s3bucket_names = (
+    os.environ["s3bucketSource"],
+    os.environ["s3bucketDest"],
+    os.environ["s3bucketFail"],
+)
+
+# Timezones for convert_time_string_to_epoch; GMT has no offset or DST, so UTC is exact
+_GMT = timezone.utc
+
+
+@functools.lru_cache(maxsize=None)
+def _eastern_tz():
+    """
+    Build the US Eastern timezone on first use rather than at import, so a missing tz
+    database only affects EST strings instead of failing the whole module.
+    """
+    return ZoneInfo("America/New_York")
+
+
+# Default format of convert_time_string_to_epoch, and the same with the HTTP Date header's
+# literal "GMT" zone (RFC 9110), which is what Rekognition responses carry
+_DEFAULT_TIME_FMT = "%a, %d %b %Y %H:%M:%S %Z"
+_HTTP_DATE_FMT = "%a, %d %b %Y %H:%M:%S GMT"
+
+# "{file_hash}/{client_id}/[batch-]{batch_id}/{current_date}/{epoch_timestamp}[-debug].{ext}"
+_S3_KEY_RE = re.compile(
+    r"^([^/]+)/([^/]+)/(?:batch-)?([^/]+)/([^/]+)/([^/.-]+)(-debug)?(?:\.[^/]*)?$"
+)
+
+# Whether validate_s3bucket has checked the buckets in this container. Bucket existence
+# does not change between warm invocations, so the HeadBucket calls are made only once.
+# Set FORCE_REVALIDATE_BUCKETS=1 to check the buckets on every invocation.
+_s3buckets_validated = False
+_FORCE_REVALIDATE_BUCKETS = os.getenv("FORCE_REVALIDATE_BUCKETS") == "1"
 
 
 def validate_s3bucket(s3_client):
     """
     Validate the existence of S3 buckets specified in environment variables.
 
-    This function checks if the source, destination, and failure S3 buckets exist.
-    If any of the buckets are not set in the environment variables or do not exist,
-    the function logs a critical error and exits the program.
+    This function checks if the source, destination, and failure S3 buckets exist. The
+    bucket names are read from the environment when the module is imported. Once the
+    buckets have been checked, later calls skip the checks, unless the
+    `FORCE_REVALIDATE_BUCKETS` environment variable was set to "1" at cold start.
 
     Args:
         s3_client (boto3.client): The S3 client used to check bucket existence.
@@ -85,21 +173,20 @@ def validate_s3bucket(s3_client):
         tuple: A tuple containing the names of the source, destination, and failure S3 buckets.
 
     Raises:
-        SystemExit: If any of the required environment variables are unset or the buckets do not exist.
+        ValueError: If a bucket does not exist.
+        PermissionError: If access to a bucket is denied.
+        RuntimeError: If a bucket cannot be checked for any other reason.
     """
-    s3bucket_env_list = (
-        os.getenv("s3bucketSource"),
-        os.getenv("s3bucketDest"),
-        os.getenv("s3bucketFail"),
-    )
-    if None in s3bucket_env_list:
-        LOG.critical("env vars are unset in bucket_env_list: <%s>", s3bucket_env_list)
-        sys.exit(42)
+    global _s3buckets_validated
 
-    for s3bucket in s3bucket_env_list:
+    if _s3buckets_validated and not _FORCE_REVALIDATE_BUCKETS:
+        return s3bucket_names
+
+    for s3bucket in s3bucket_names:
         check_bucket_exists(s3_client=s3_client, bucket_name=s3bucket)
 
-    return s3bucket_env_list
+    _s3buckets_validated = True
+    return s3bucket_names
 
 
 def get_s3_key_from_event(event):
@@ -152,7 +239,7 @@ def get_s3_key_from_event(event):
 
 
 #     return epoch_time
-def convert_time_string_to_epoch(time_string, format_string="%a, %d %b %Y %H:%M:%S %Z"):
+def convert_time_string_to_epoch(time_string, format_string=_DEFAULT_TIME_FMT):
     """
     Convert a time string to epoch time.
 
@@ -166,18 +253,23 @@ def convert_time_string_to_epoch(time_string, format_string="%a, %d %b %Y %H:%M:
     Raises:
         ValueError: If the time string does not match the specified format.
     """
+    if format_string == _DEFAULT_TIME_FMT:
+        # Fast path for HTTP dates: the fields are already UTC, so no timezone is attached
+        try:
+            return calendar.timegm(time.strptime(time_string, _HTTP_DATE_FMT))
+        except (TypeError, ValueError):
+            pass
+
     try:
         # Parse the time string into a naive datetime object
         dt_object = datetime.strptime(time_string, format_string)
 
         # Handle timezone-aware strings
         if "GMT" in time_string:
-            tz = pytz.timezone("GMT")
-            dt_object = tz.localize(dt_object)
+            dt_object = dt_object.replace(tzinfo=_GMT)
         # TODO: EST timezone not handled properly - investigate
         elif "EST" in time_string:
-            tz = pytz.timezone("US/Eastern")
-            dt_object = tz.localize(dt_object)
+            dt_object = dt_object.replace(tzinfo=_eastern_tz())
         else:
             # Assume naive datetime objects are in UTC
             dt_object = dt_object.replace(tzinfo=timezone.utc)
@@ -190,7 +282,10 @@ def convert_time_string_to_epoch(time_string, format_string="%a, %d %b %Y %H:%M:
 
 def convert_to_json(data):
     """
-    Convert any supported Python data type to a JSON string.
+    Convert any supported Python data type to a compact JSON string.
+
+    The output has no indentation or whitespace between separators, keeping DynamoDB items
+    small.
 
     Args:
         data: The data to convert. Can be a primitive type, complex type, or nested structure.
@@ -199,7 +294,7 @@ def convert_to_json(data):
         str: The JSON string representation of the data.
     """
     try:
-        json_string = json.dumps(data, indent=4)
+        json_string = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
         return json_string
     except TypeError as err:
         print(f"Error: Data type not serializable to JSON. {err}")
@@ -234,22 +329,15 @@ def gen_item_dict1_from_s3key(s3_key, s3_bucket):
         ValueError: If the S3 key does not match the expected format.
     """
     try:
-        parts = s3_key.split("/")
-        if len(parts) != 5:
+        match = _S3_KEY_RE.match(s3_key)
+        if not match:
             raise ValueError("S3 key does not match the expected format.")
 
-        #
-        file_hash = parts[0]
-        client_id = parts[1]
-        batch_id = parts[2].replace("batch-", "")
-        current_date = parts[3]
-        epoch_timestamp_isdebug_check = parts[4].split(".")[0].split("-")
-
-        epoch_timestamp = epoch_timestamp_isdebug_check[0]
+        file_hash, client_id, batch_id, current_date, epoch_timestamp, debug_suffix = (
+            match.groups()
+        )
 
-        is_debug = False
-        if len(epoch_timestamp_isdebug_check) == 2:
-            is_debug = True
+        is_debug = debug_suffix is not None
         global_context["is_debug"] = is_debug
         LOG.info(
             "in gen_item_dict1_from_s3key() is_debug set to: %s with type <%s>",
@@ -308,9 +396,11 @@ def gen_item_dict2_from_rek_resp(rekog_results):
 
         rek_match = rekog_results.get("rek_match", None)
 
-        rek_long_time_string = safeget(
-            rekog_resp, "ResponseMetadata", "HTTPHeaders", "date"
-        )
+        # Walk down to the response metadata once for both the date and the status code
+        rek_meta = rekog_resp.get("ResponseMetadata") or {}
+        rek_headers = rek_meta.get("HTTPHeaders") or {}
+
+        rek_long_time_string = rek_headers.get("date")
         rek_ts = convert_time_string_to_epoch(
             time_string=rek_long_time_string, format_string="%a, %d %b %Y %H:%M:%S %Z"
         )
@@ -321,7 +411,7 @@ def gen_item_dict2_from_rek_resp(rekog_results):
         #     "TODO": {"placeholder": {"S": "empty dict for now"}}
         # }  # rekog_resp.get("Labels")
 
-        rek_status_code = safeget(rekog_resp, "ResponseMetadata", "HTTPStatusCode")
+        rek_status_code = rek_meta.get("HTTPStatusCode")
         op_status = "success" if rek_status_code == 200 else "fail"
 
         # Construct item_dict2
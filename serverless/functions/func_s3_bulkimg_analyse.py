@@ -57,6 +57,7 @@ import os
 from functions.data import required_dyndb_keys
 from functions.fhelpers import (
     convert_to_json,
+    dyndb_ttl,
     gen_item_dict1_from_s3key,
     gen_item_dict2_from_rek_resp,
     get_s3_key_from_event,
@@ -120,7 +121,6 @@ rekog_client = gen_boto3_client("rekognition", aws_region)
 dyndb_client = gen_boto3_client("dynamodb", aws_region)
 #
 dyndb_table_name = os.getenv("dynamoDBTableName")
-dyndb_ttl = os.getenv("dynamoDBTTL")
 
 LOG.info("aws_region: <%s>", aws_region)
 LOG.info("dyndb_table_name: <%s>", dyndb_table_name)
@@ -213,6 +213,10 @@ def run(event, context):
         - TODO: Implement retries for failed S3 object moves and integrate with SQS DLQs.
     """
 
+    # Start each invocation from the default context, so a warm container never logs
+    # the previous invocation's batch_id, img_fprint or is_debug
+    global_context.clear()
+
     LOG.info("event: <%s> - <%s>", type(context), context)
     LOG.info("event: <%s> - <%s>", type(event), event)
 
@@ -257,12 +261,13 @@ def run(event, context):
             rekog_client=rekog_client, image_bytes=file_bytes, label_pattern="cat"
         )
 
-        rekog_resp = rekog_results.get("rekog_resp")
-        LOG.info("rekog_resp: <%s>", rekog_resp)
+        # The full response can be many KB, and gen_item_dict2_from_rek_resp already logs
+        # it serialized inside item_dict2, so only format it here when debugging
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("rekog_resp: <%s>", rekog_results.get("rekog_resp"))
 
         # Step 5: Update DynamoDB with Rekognition response
         item_dict2 = gen_item_dict2_from_rek_resp(rekog_results=rekog_results)
-        LOG.info("item_dict2: <%s>", item_dict2)
         dynamodb_helper.update_item(item_dict=item_dict2)
 
         # Step 6: Handle Rekognition response by moving image to appropriate S3 bucket
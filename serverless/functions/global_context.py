@@ -1,34 +1,95 @@
 """
 Module: global_context
 
-This module defines a global dictionary to store shared context information that can be
-accessed and updated across different parts of the application. It is primarily used for
-storing metadata such as batch IDs, image fingerprints, and debug flags, which are useful
-for logging and debugging purposes.
+This module defines the shared context information that can be accessed and updated across
+different parts of the application. It is primarily used for storing metadata such as batch
+IDs, image fingerprints, and debug flags, which are useful for logging and debugging purposes.
+
+Each field is held in a `contextvars.ContextVar`, so values are scoped to the execution
+context that set them and do not bleed between concurrent invocations in threads or tasks.
+`global_context` is a dict-style view over those variables for existing callers.
 
 Attributes:
-    global_context (dict): A global dictionary to store shared context information.
-        - batch_id (str or None): The ID of the current batch being processed.
-        - img_fprint (str or None): The fingerprint (hash) of the current image being processed.
-        - is_debug (bool): A flag indicating whether the application is running in debug mode.
+    batch_id_var (ContextVar): The ID of the current batch being processed (str or None).
+    img_fprint_var (ContextVar): The fingerprint (hash) of the current image being processed
+        (str or None).
+    is_debug_var (ContextVar): A flag indicating whether the application is running in debug
+        mode (bool).
+    global_context (MutableMapping): A dict-style view of the context variables above, keyed
+        by `batch_id`, `img_fprint` and `is_debug`.
 
 Usage:
     This module is imported wherever shared context information needs to be accessed or updated.
 
 Example:
     # Access the global context
-    batch_id = global_context["batch_id"]
+    batch_id = global_context["batch_id"]  # or batch_id_var.get()
 
     # Update the global context
-    global_context["is_debug"] = True
+    global_context["is_debug"] = True  # or is_debug_var.set(True)
 
     # Log the current context
     LOG.info("Current context: %s", global_context)
 """
 
-# Global dictionary to store shared context (for atexit logging)
-global_context = {
-    "batch_id": None,
-    "img_fprint": None,
-    "is_debug": False,
-}
+from collections.abc import MutableMapping
+from contextvars import ContextVar
+
+batch_id_var = ContextVar("batch_id", default=None)
+img_fprint_var = ContextVar("img_fprint", default=None)
+is_debug_var = ContextVar("is_debug", default=False)
+
+
+class _ContextVarMapping(MutableMapping):
+    """
+    Dict-style view of a fixed set of context variables.
+
+    Reading a key returns the variable's value in the current context, and assigning a key
+    sets it. Deleting a key, or calling `clear`, restores the default, so every key is always
+    present. Unknown keys raise `KeyError`.
+    """
+
+    def __init__(self, variables, defaults):
+        """
+        Initializes the _ContextVarMapping class.
+
+        Args:
+            variables (dict): The context variables, keyed by name.
+            defaults (dict): The default value of each variable, keyed by name.
+        """
+        self._variables = variables
+        self._defaults = defaults
+
+    def __getitem__(self, key):
+        return self._variables[key].get()
+
+    def __setitem__(self, key, value):
+        self._variables[key].set(value)
+
+    def __delitem__(self, key):
+        self._variables[key].set(self._defaults[key])
+
+    def __iter__(self):
+        return iter(self._variables)
+
+    def __len__(self):
+        return len(self._variables)
+
+    def clear(self):
+        # The inherited clear() pops items until the mapping is empty, which never happens
+        for key in self._variables:
+            del self[key]
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+# Shared context (for atexit logging)
+global_context = _ContextVarMapping(
+    variables={
+        "batch_id": batch_id_var,
+        "img_fprint": img_fprint_var,
+        "is_debug": is_debug_var,
+    },
+    defaults={"batch_id": None, "img_fprint": None, "is_debug": False},
+)
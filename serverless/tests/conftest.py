@@ -18,6 +18,7 @@ Dependencies:
 
 Fixtures:
 - `reset_global_context`: Resets the global context before each test.
+- `reset_validated_s3buckets`: Clears the buckets cached by `validate_s3bucket` before each test.
 - `set_env_vars`: Sets required environment variables for tests.
 - `mock_aws_clients`: Provides mocked AWS clients for S3, Rekognition, and DynamoDB.
 - `mock_dynamodb_helper`: Mocks the DynamoDBHelper object.
@@ -49,6 +50,15 @@ modules_path = os.path.abspath(os.path.join(repo_root, "modules"))
 sys.path.insert(0, modules_path)
 
 
+# fhelpers checks these when it is imported, before the set_env_vars fixture runs
+os.environ.setdefault("dynamoDBTTL", "1209600")
+os.environ.setdefault("s3bucketSource", "source-bucket")
+os.environ.setdefault("s3bucketDest", "dest-bucket")
+os.environ.setdefault("s3bucketFail", "fail-bucket")
+
+import functions.fhelpers
+
+import serverless.functions.fhelpers
 from serverless.functions.global_context import global_context
 
 ### constants
@@ -76,6 +86,21 @@ def reset_global_context():
     global_context["is_debug"] = False
 
 
+@pytest.fixture(autouse=True)
+def reset_validated_s3buckets():
+    """
+    Clear the bucket names cached by `validate_s3bucket` before each test.
+
+    The tests import `fhelpers` both as `functions.fhelpers` and as
+    `serverless.functions.fhelpers`, so the cache is cleared in both modules.
+
+    Modifies:
+        - `_s3buckets_validated`: Set to `False` so the buckets are checked again.
+    """
+    functions.fhelpers._s3buckets_validated = False
+    serverless.functions.fhelpers._s3buckets_validated = False
+
+
 @pytest.fixture(autouse=True)
 def set_env_vars():
     """
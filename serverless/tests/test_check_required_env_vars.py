@@ -0,0 +1,130 @@
+"""
+Module: test_check_required_env_vars
+
+This module contains unit tests for the `check_required_env_vars` function in the
+`serverless.functions.fhelpers` module. The `check_required_env_vars` function is called
+when the module is imported, so a Lambda with missing configuration fails its INIT phase.
+
+The tests in this module ensure that:
+- The function passes when all required environment variables are set.
+- The function raises a `RuntimeError` naming every unset or empty environment variable.
+- A critical error is logged before raising.
+- `get_int_env_var` raises a `RuntimeError` naming a variable that is not an integer.
+
+Dependencies:
+- pytest: For test execution and assertions.
+- mocker: For mocking the logger.
+- monkeypatch: For setting and removing environment variables.
+- serverless.functions.fhelpers.check_required_env_vars: The function under test.
+- serverless.functions.fhelpers.get_int_env_var: The function under test.
+"""
+
+import pytest
+
+from serverless.functions.fhelpers import (
+    REQUIRED_ENV_VARS,
+    check_required_env_vars,
+    get_int_env_var,
+)
+
+
+class TestCheckRequiredEnvVars:
+    """
+    Test suite for the `check_required_env_vars` function.
+    """
+
+    # Passes when all required environment variables are set
+    def test_passes_when_all_vars_set(self, monkeypatch):
+        """
+        Test that no exception is raised when all required environment variables are set.
+
+        Args:
+            monkeypatch: The pytest fixture for setting environment variables.
+
+        Asserts:
+            - The function returns `None`.
+        """
+        # Arrange
+        for name in REQUIRED_ENV_VARS:
+            monkeypatch.setenv(name, "value")
+
+        # Act & Assert
+        assert check_required_env_vars() is None
+
+    # Raises RuntimeError naming each unset or empty variable
+    def test_raises_for_unset_and_empty_vars(self, mocker, monkeypatch):
+        """
+        Test that a `RuntimeError` is raised listing every unset or empty environment
+        variable, and that a critical error is logged.
+
+        Args:
+            mocker: The pytest-mock fixture for mocking dependencies.
+            monkeypatch: The pytest fixture for setting and removing environment variables.
+
+        Asserts:
+            - A `RuntimeError` is raised naming the unset and empty variables only.
+            - A critical log message is generated.
+        """
+        # Arrange
+        monkeypatch.setenv("dynamoDBTTL", "1209600")
+        monkeypatch.delenv("s3bucketDest", raising=False)
+        monkeypatch.setenv("s3bucketFail", "")
+        log_mock = mocker.patch("serverless.functions.fhelpers.LOG")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError) as excinfo:
+            check_required_env_vars()
+
+        assert "s3bucketDest" in str(excinfo.value)
+        assert "s3bucketFail" in str(excinfo.value)
+        assert "dynamoDBTTL" not in str(excinfo.value)
+        log_mock.critical.assert_called_once()
+
+
+class TestGetIntEnvVar:
+    """
+    Test suite for the `get_int_env_var` function.
+    """
+
+    # Returns the integer value of the environment variable
+    def test_returns_int_value(self, monkeypatch):
+        """
+        Test that an integer environment variable is returned as an `int`.
+
+        Args:
+            monkeypatch: The pytest fixture for setting environment variables.
+
+        Asserts:
+            - The returned value is the integer.
+        """
+        # Arrange
+        monkeypatch.setenv("dynamoDBTTL", "1209600")
+
+        # Act & Assert
+        assert get_int_env_var("dynamoDBTTL") == 1209600
+
+    # Raises RuntimeError naming the variable when it is not an integer
+    def test_raises_for_non_integer_value(self, mocker, monkeypatch):
+        """
+        Test that a `RuntimeError` naming the variable is raised when its value is not
+        an integer, and that a critical error is logged.
+
+        Args:
+            mocker: The pytest-mock fixture for mocking dependencies.
+            monkeypatch: The pytest fixture for setting environment variables.
+
+        Asserts:
+            - A `RuntimeError` is raised naming the variable and its value.
+            - A critical log message is generated.
+        """
+        # Arrange
+        monkeypatch.setenv("dynamoDBTTL", "two weeks")
+        log_mock = mocker.patch("serverless.functions.fhelpers.LOG")
+
+        # Act & Assert
+        with pytest.raises(RuntimeError) as excinfo:
+            get_int_env_var("dynamoDBTTL")
+
+        assert "dynamoDBTTL" in str(excinfo.value)
+        assert "two weeks" in str(excinfo.value)
+        log_mock.critical.assert_called_once()
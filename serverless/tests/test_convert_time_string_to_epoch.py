@@ -176,6 +176,25 @@ class TestConvertTimeStringToEpoch:
         # Assert
         assert result == expected_epoch
 
+    # Test handling of a default-format time string in a zone other than GMT
+    def test_default_format_with_utc_timezone(self):
+        """
+        Test that a default-format time string with the UTC timezone, which does not
+        match the HTTP date fast path, is still converted to an epoch timestamp.
+
+        Asserts:
+            - The returned epoch timestamp matches the expected value.
+        """
+        # Arrange
+        time_string = "Mon, 01 Jan 2023 12:00:00 UTC"
+        expected_epoch = 1672574400
+
+        # Act
+        result = convert_time_string_to_epoch(time_string)
+
+        # Assert
+        assert result == expected_epoch
+
     # Test handling of unsupported timezone
     def test_unsupported_timezone(self):
         """
@@ -9,7 +9,8 @@ The tests in this module ensure that:
 - Simple and nested data structures are correctly converted to JSON strings.
 - Empty data structures and `None` values are handled appropriately.
 - Circular references in data structures are managed gracefully (TODO: fix test).
-- The resulting JSON strings are valid and match the expected format.
+- The resulting JSON strings are valid and match the expected compact format.
+- Non-ASCII characters are written as-is, and unserializable values return `None`.
 
 Dependencies:
 - pytest: For test execution and assertions.
@@ -18,6 +19,7 @@ Dependencies:
 """
 
 import json
+from datetime import datetime, timezone
 
 from serverless.functions.fhelpers import convert_to_json
 
@@ -43,7 +45,7 @@ class TestConvertToJson:
         result = convert_to_json(data)
 
         # Assert
-        expected = json.dumps(data, indent=4)
+        expected = json.dumps(data, separators=(",", ":"))
         assert result == expected
         assert json.loads(result) == data
 
@@ -63,7 +65,7 @@ class TestConvertToJson:
         result = convert_to_json(data)
 
         # Assert
-        expected = json.dumps(data, indent=4)
+        expected = json.dumps(data, separators=(",", ":"))
         assert result == expected
         assert json.loads(result) == data
 
@@ -90,7 +92,7 @@ class TestConvertToJson:
         result = convert_to_json(data)
 
         # Assert
-        expected = json.dumps(data, indent=4)
+        expected = json.dumps(data, separators=(",", ":"))
         assert result == expected
         assert json.loads(result) == data
 
@@ -113,8 +115,8 @@ class TestConvertToJson:
         list_result = convert_to_json(empty_list)
 
         # Assert
-        assert dict_result == json.dumps({}, indent=4)
-        assert list_result == json.dumps([], indent=4)
+        assert dict_result == json.dumps({}, separators=(",", ":"))
+        assert list_result == json.dumps([], separators=(",", ":"))
         assert json.loads(dict_result) == empty_dict
         assert json.loads(list_result) == empty_list
 
@@ -133,10 +135,46 @@ class TestConvertToJson:
         result = convert_to_json(data)
 
         # Assert
-        expected = json.dumps(None, indent=4)
+        expected = json.dumps(None, separators=(",", ":"))
         assert result == expected
         assert result == "null"
 
+    # Writes non-ASCII characters as-is in compact form
+    def test_convert_non_ascii(self):
+        """
+        Test that non-ASCII characters are written as-is in the compact JSON string.
+
+        Asserts:
+            - The resulting JSON string matches the compact format.
+            - Non-ASCII characters are written as-is rather than escaped.
+        """
+        # Arrange
+        data = {"name": "Zoë", "tags": ["cat", "dog"], "nested": {"score": 99}}
+
+        # Act
+        result = convert_to_json(data)
+
+        # Assert
+        assert result == '{"name":"Zoë","tags":["cat","dog"],"nested":{"score":99}}'
+        assert json.loads(result) == data
+
+    # Returns None for data that is not JSON serializable
+    def test_unserializable_data_returns_none(self):
+        """
+        Test that data the standard `json` module cannot serialize returns `None`.
+
+        Asserts:
+            - The result is `None` for a `datetime` value.
+        """
+        # Arrange
+        data = {"created": datetime(2023, 1, 1, tzinfo=timezone.utc)}
+
+        # Act
+        result = convert_to_json(data)
+
+        # Assert
+        assert result is None
+
     # TODO: fix the test test_handle_circular_references
     # Handle circular references in data structure
     # def test_handle_circular_references(self):
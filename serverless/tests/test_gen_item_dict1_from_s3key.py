@@ -44,7 +44,7 @@ class TestGenItemDict1FromS3key:
             - The resulting dictionary contains the expected keys and values.
         """
         # Arrange
-        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", "1234567890")
+        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", 1234567890)
         s3_key = "abc123/client001/batch-456/2023-01-01/1672531200.png"
         s3_bucket = "test-bucket"
 
@@ -62,7 +62,7 @@ class TestGenItemDict1FromS3key:
             == "test-bucket/abc123/client001/batch-456/2023-01-01/1672531200.png"
         )
         assert result["op_status"] == "pending"
-        assert result["ttl"] == "1234567890"
+        assert result["ttl"] == 1234567890
 
     # Updates global_context with batch_id, img_fprint, and is_debug values
     def test_global_context_update(self, mocker):
@@ -78,7 +78,7 @@ class TestGenItemDict1FromS3key:
               image fingerprint, and debug status.
         """
         # Arrange
-        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", "1234567890")
+        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", 1234567890)
         mocker.patch("serverless.functions.fhelpers.global_context", global_context)
         s3_key = "hash789/client123/batch-456/2023-06-30/1688083200.png"
         s3_bucket = "test-bucket"
@@ -105,7 +105,7 @@ class TestGenItemDict1FromS3key:
             - The resulting dictionary contains the expected metadata values.
         """
         # Arrange
-        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", "1234567890")
+        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", 1234567890)
 
         log_mock = mocker.patch("serverless.functions.fhelpers.LOG")
         s3_key = "hash123/client456/batch-303/2023-07-15/1689465600-debug.png"
@@ -162,7 +162,7 @@ class TestGenItemDict1FromS3key:
             - The resulting dictionary contains the batch ID without the "batch-" prefix.
         """
         # Arrange
-        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", "1234567890")
+        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", 1234567890)
 
         # Test with batch- prefix
         s3_key_with_prefix = "hash123/client456/batch-789/2023-08-01/1690934400.png"
@@ -184,3 +184,30 @@ class TestGenItemDict1FromS3key:
 
         # Assert
         assert result_without_prefix["batch_id"] == "789"
+
+    # Only the file name segment is inspected for the "-debug" suffix
+    def test_hyphens_outside_file_name_are_not_debug(self, mocker):
+        """
+        Test that hyphens in the client ID and date segments are kept as-is and do not
+        set the `is_debug` flag; only a "-debug" suffix on the file name does.
+
+        Args:
+            mocker: The pytest-mock fixture for mocking dependencies.
+
+        Asserts:
+            - The client ID and date keep their hyphens.
+            - The `is_debug` flag in the global context is `False`.
+        """
+        # Arrange
+        mocker.patch("serverless.functions.fhelpers.dyndb_ttl", 1234567890)
+        s3_key = "hash123/client-456/batch-303/2024-01-02/1704153600.jpg"
+        s3_bucket = "test-bucket"
+
+        # Act
+        result = gen_item_dict1_from_s3key(s3_key, s3_bucket)
+
+        # Assert
+        assert result["client_id"] == "client-456"
+        assert result["current_date"] == "2024-01-02"
+        assert result["upload_ts"] == "1704153600"
+        assert global_context["is_debug"] is False
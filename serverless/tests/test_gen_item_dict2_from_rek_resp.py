@@ -47,12 +47,6 @@ class TestGenItemDict2FromRekResp:
             {"batch_id": "test-batch-123", "img_fprint": "abc123hash"},
         )
 
-        # Mock safeget function
-        mock_safeget = mocker.patch("serverless.functions.fhelpers.safeget")
-        mock_safeget.side_effect = lambda d, *keys: (
-            "Wed, 01 Jan 2023 12:00:00 GMT" if "date" in keys else 200
-        )
-
         # Mock convert_time_string_to_epoch
         mock_convert = mocker.patch(
             "serverless.functions.fhelpers.convert_time_string_to_epoch"
@@ -109,11 +103,6 @@ class TestGenItemDict2FromRekResp:
         )
 
         # Mock other dependencies
-        mock_safeget = mocker.patch("serverless.functions.fhelpers.safeget")
-        mock_safeget.side_effect = lambda d, *keys: (
-            "Wed, 01 Jan 2023 12:00:00 GMT" if "date" in keys else 200
-        )
-
         mock_convert = mocker.patch(
             "serverless.functions.fhelpers.convert_time_string_to_epoch"
         )
@@ -160,12 +149,6 @@ class TestGenItemDict2FromRekResp:
             {"batch_id": "test-batch", "img_fprint": "test-hash"},
         )
 
-        # Mock safeget to return a specific timestamp
-        mock_safeget = mocker.patch("serverless.functions.fhelpers.safeget")
-        mock_safeget.side_effect = lambda d, *keys: (
-            "Thu, 15 Jun 2023 08:30:45 GMT" if "date" in keys else 200
-        )
-
         # Mock convert_to_json
         mock_json = mocker.patch("serverless.functions.fhelpers.convert_to_json")
         mock_json.return_value = "{}"
@@ -224,8 +207,7 @@ class TestGenItemDict2FromRekResp:
         # Mock logger
         mock_logger = mocker.patch("serverless.functions.fhelpers.LOG")
 
-        # Mock safeget and convert functions
-        mocker.patch("serverless.functions.fhelpers.safeget")
+        # Mock convert functions
         mocker.patch("serverless.functions.fhelpers.convert_time_string_to_epoch")
         mocker.patch("serverless.functions.fhelpers.convert_to_json")
 
@@ -258,12 +240,6 @@ class TestGenItemDict2FromRekResp:
             {"batch_id": "test-batch", "img_fprint": "test-hash"},
         )
 
-        # Mock safeget
-        mock_safeget = mocker.patch("serverless.functions.fhelpers.safeget")
-        mock_safeget.side_effect = lambda d, *keys: (
-            "Wed, 01 Jan 2023 12:00:00 GMT" if "date" in keys else 500
-        )
-
         # Mock convert_time_string_to_epoch
         mock_convert = mocker.patch(
             "serverless.functions.fhelpers.convert_time_string_to_epoch"
@@ -316,10 +292,6 @@ class TestGenItemDict2FromRekResp:
             {"batch_id": "test-batch", "img_fprint": "test-hash"},
         )
 
-        # Mock safeget to return None for missing metadata
-        mock_safeget = mocker.patch("serverless.functions.fhelpers.safeget")
-        mock_safeget.return_value = None
-
         # Mock logger
         mock_logger = mocker.patch("serverless.functions.fhelpers.LOG")
 
@@ -0,0 +1,121 @@
+"""
+Module: test_global_context
+
+This module contains unit tests for the `global_context` mapping in the
+`serverless.functions.global_context` module. The `global_context` mapping is a dict-style
+view over the `batch_id_var`, `img_fprint_var` and `is_debug_var` context variables.
+
+The tests in this module ensure that:
+- Reads and writes through `global_context` go to the underlying context variables.
+- Values set in one execution context are not visible in another.
+- Deleting keys or clearing the mapping restores the defaults.
+- Unknown keys are rejected.
+
+Dependencies:
+- pytest: For test execution and assertions.
+- contextvars: For running code in a copied execution context.
+- serverless.functions.global_context: The module under test.
+"""
+
+import contextvars
+
+import pytest
+
+from serverless.functions.global_context import (
+    batch_id_var,
+    global_context,
+    img_fprint_var,
+    is_debug_var,
+)
+
+
+class TestGlobalContext:
+    """
+    Test suite for the `global_context` mapping.
+    """
+
+    # Reads and writes go to the underlying context variables
+    def test_proxies_context_variables(self):
+        """
+        Test that reads and writes through `global_context` go to the context variables.
+
+        Asserts:
+            - Values assigned through the mapping are returned by the variables.
+            - Values set on the variables are returned by the mapping.
+        """
+        # Act
+        global_context["batch_id"] = "456"
+        img_fprint_var.set("hash789")
+
+        # Assert
+        assert batch_id_var.get() == "456"
+        assert global_context["img_fprint"] == "hash789"
+        assert dict(global_context) == {
+            "batch_id": "456",
+            "img_fprint": "hash789",
+            "is_debug": False,
+        }
+
+    # Values set in another execution context do not leak into this one
+    def test_values_are_scoped_to_the_context(self):
+        """
+        Test that values set inside a copied execution context do not leak out of it.
+
+        Asserts:
+            - The copied context sees the values set before it was copied.
+            - Values set inside the copied context are not visible outside it.
+        """
+
+        # Arrange
+        def set_in_other_context():
+            seen = global_context["batch_id"]
+            global_context["batch_id"] = "other"
+            global_context["is_debug"] = True
+            return seen
+
+        global_context["batch_id"] = "456"
+
+        # Act
+        seen = contextvars.copy_context().run(set_in_other_context)
+
+        # Assert
+        assert seen == "456"
+        assert global_context["batch_id"] == "456"
+        assert is_debug_var.get() is False
+
+    # Deleting keys and clearing restore the defaults
+    def test_delete_and_clear_restore_defaults(self):
+        """
+        Test that deleting a key or clearing the mapping restores the default values.
+
+        Asserts:
+            - A deleted key reads back as its default.
+            - After `clear`, every key is present with its default value.
+        """
+        # Arrange
+        global_context.update(batch_id="456", img_fprint="hash789", is_debug=True)
+
+        # Act & Assert
+        del global_context["batch_id"]
+        assert global_context["batch_id"] is None
+
+        global_context.clear()
+        assert dict(global_context) == {
+            "batch_id": None,
+            "img_fprint": None,
+            "is_debug": False,
+        }
+
+    # Unknown keys raise KeyError
+    def test_unknown_key_raises_key_error(self):
+        """
+        Test that reading or writing a key without a context variable raises a `KeyError`.
+
+        Asserts:
+            - A `KeyError` is raised for both reads and writes.
+        """
+        # Act & Assert
+        with pytest.raises(KeyError):
+            global_context["unknown"] = "value"
+        with pytest.raises(KeyError):
+            global_context["unknown"]
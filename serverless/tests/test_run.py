@@ -1,4 +1,6 @@
+import pytest
 from functions.func_s3_bulkimg_analyse import run
+from functions.global_context import global_context
 
 
 class TestRun:
@@ -103,6 +105,11 @@ class TestRun:
         }
         context = {}
 
+        # Spy on INFO logging to check the Rekognition response is not logged at INFO
+        from functions.func_s3_bulkimg_analyse import LOG
+
+        log_info_spy = mocker.spy(LOG, "info")
+
         # Call the function under test
         from functions.func_s3_bulkimg_analyse import run
 
@@ -119,6 +126,31 @@ class TestRun:
         mock_dynamodb_helper.update_item.assert_called()
         mock_move.assert_called_once()
         mock_write_logs.assert_called_once()
+        info_messages = [call.args[0] for call in log_info_spy.call_args_list]
+        assert not any(
+            msg.startswith(("rekog_resp", "item_dict2")) for msg in info_messages
+        )
+
+    # Starts each invocation from the default global_context, dropping values left by the last one
+    def test_resets_global_context_at_invocation_start(self, mocker):
+        # Arrange - values left over from a previous invocation in a warm container
+        global_context.update(batch_id="stale", img_fprint="stale", is_debug=True)
+        seen = {}
+
+        def validate(s3_client):
+            seen.update(global_context)
+            raise SystemExit(42)
+
+        mocker.patch(
+            "functions.func_s3_bulkimg_analyse.validate_s3bucket", side_effect=validate
+        )
+
+        # Act
+        with pytest.raises(SystemExit):
+            run({}, {})
+
+        # Assert
+        assert seen == {"batch_id": None, "img_fprint": None, "is_debug": False}
 
     # Correctly extracts S3 key from event and validates S3 buckets
     def test_s3_key_extraction_and_bucket_validation(self, mocker):
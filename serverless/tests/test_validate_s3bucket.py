@@ -6,9 +6,9 @@ This module contains unit tests for the `validate_s3bucket` function in the
 for validating the existence of S3 buckets and retrieving their names from environment variables.
 
 The tests in this module ensure that:
-- The function correctly retrieves bucket names from environment variables.
+- The function returns the bucket names read from environment variables at import.
 - The function validates the existence of the specified S3 buckets.
-- Proper error handling is implemented for missing environment variables or non-existent buckets.
+- Proper error handling is implemented for non-existent buckets.
 
 Dependencies:
 - pytest: For test execution and assertions.
@@ -22,7 +22,6 @@ Fixtures:
 """
 
 import pytest
-from boto3_helpers import LOG
 
 from serverless.functions.fhelpers import validate_s3bucket
 from serverless.tests.conftest import bucket_names
@@ -88,114 +87,120 @@ class TestValidateS3bucket:
                 s3_client=s3_client_mock, bucket_name=bucket
             )
 
-    # Properly retrieves environment variables using os.getenv
-    def test_retrieves_correct_environment_variables(self, mocker, mock_aws_clients):
+    # Uses the bucket names read at import rather than reading the environment per call
+    def test_uses_bucket_names_read_at_import(self, mocker, mock_aws_clients):
         """
-        Test that `validate_s3bucket` retrieves the correct environment variables
-        using `os.getenv`.
+        Test that `validate_s3bucket` checks and returns the bucket names read when the
+        module was imported, without reading the environment again.
 
         Args:
             mocker: The pytest-mock fixture for mocking dependencies.
             mock_aws_clients: The fixture providing mocked AWS clients.
 
         Asserts:
-            - `os.getenv` is called with the correct environment variable names.
+            - `os.getenv` is not called.
+            - The bucket names read at import are checked and returned.
         """
         # Arrange
         s3_client_mock, _, _ = mock_aws_clients
+        bucket_tuple = ("other-source", "other-dest", "other-fail")
+        mocker.patch("serverless.functions.fhelpers.s3bucket_names", bucket_tuple)
         getenv_mock = mocker.patch("os.getenv")
-        mocker.patch("serverless.functions.fhelpers.check_bucket_exists")
+        check_bucket_mock = mocker.patch(
+            "serverless.functions.fhelpers.check_bucket_exists"
+        )
 
         # Act
-        validate_s3bucket(s3_client_mock)
+        result = validate_s3bucket(s3_client_mock)
 
         # Assert
-        getenv_mock.assert_has_calls(
-            [
-                mocker.call("s3bucketSource"),
-                mocker.call("s3bucketDest"),
-                mocker.call("s3bucketFail"),
-            ]
-        )
+        getenv_mock.assert_not_called()
+        assert result == bucket_tuple
+        for bucket in bucket_tuple:
+            check_bucket_mock.assert_any_call(
+                s3_client=s3_client_mock, bucket_name=bucket
+            )
 
-    # Exits with code 42 when any environment variable is None
-    def test_exits_when_env_var_is_none(self, mocker, mock_aws_clients):
+    # Behavior when check_bucket_exists raises an exception
+    def test_propagates_exception_from_check_bucket_exists(
+        self, mocker, mock_aws_clients
+    ):
         """
-        Test that `validate_s3bucket` exits with code 42 when any environment
-        variable is not set.
+        Test that `validate_s3bucket` propagates exceptions raised by
+        `check_bucket_exists`.
 
         Args:
             mocker: The pytest-mock fixture for mocking dependencies.
             mock_aws_clients: The fixture providing mocked AWS clients.
 
         Asserts:
-            - `sys.exit` is called with the exit code 42.
+            - An exception is raised when `check_bucket_exists` fails.
+            - The exception message matches the expected error.
         """
         # Arrange
         s3_client_mock, _, _ = mock_aws_clients
-        mocker.patch("os.getenv", side_effect=["source-bucket", None, "fail-bucket"])
-        sys_exit_mock = mocker.patch("sys.exit")
 
-        # Act
-        validate_s3bucket(s3_client_mock)
+        check_bucket_mock = mocker.patch(
+            "serverless.functions.fhelpers.check_bucket_exists"
+        )  # Correct import path
+        check_bucket_mock.side_effect = Exception("Bucket does not exist")
 
-        # Assert
-        sys_exit_mock.assert_called_once_with(42)
+        # Act & Assert
+        with pytest.raises(Exception) as excinfo:
+            validate_s3bucket(s3_client_mock)
 
-    # Logs critical error when environment variables are unset
-    def test_logs_critical_error_when_env_vars_unset(self, mocker, mock_aws_clients):
+        assert "Bucket does not exist" in str(excinfo.value)
+
+    # Skips the bucket checks on warm invocations once the buckets have been validated
+    def test_skips_checks_for_already_validated_buckets(self, mocker, mock_aws_clients):
         """
-        Test that `validate_s3bucket` logs a critical error when environment
-        variables are unset.
+        Test that `validate_s3bucket` checks the buckets only on the first call.
 
         Args:
             mocker: The pytest-mock fixture for mocking dependencies.
             mock_aws_clients: The fixture providing mocked AWS clients.
 
         Asserts:
-            - A critical log message is generated indicating unset environment variables.
+            - `check_bucket_exists` is called three times in total over two calls.
+            - Both calls return the bucket names.
         """
         # Arrange
         s3_client_mock, _, _ = mock_aws_clients
-        env_vars = ["source-bucket", None, "fail-bucket"]
-        mocker.patch("os.getenv", side_effect=env_vars)
-        mocker.patch("sys.exit")
-        log_mock = mocker.patch.object(LOG, "critical")
+        check_bucket_mock = mocker.patch(
+            "serverless.functions.fhelpers.check_bucket_exists"
+        )
 
         # Act
-        validate_s3bucket(s3_client_mock)
+        first_result = validate_s3bucket(s3_client_mock)
+        second_result = validate_s3bucket(s3_client_mock)
 
         # Assert
-        log_mock.assert_called_once()
-        assert "env vars are unset" in log_mock.call_args[0][0]
-        assert str(tuple(env_vars)) in str(log_mock.call_args[0][1])
+        assert check_bucket_mock.call_count == 3
+        assert first_result == second_result == tuple(bucket_names.values())
 
-    # Behavior when check_bucket_exists raises an exception
-    def test_propagates_exception_from_check_bucket_exists(
-        self, mocker, mock_aws_clients
-    ):
+    # Checks the buckets on every call when FORCE_REVALIDATE_BUCKETS is set
+    def test_force_revalidate_checks_every_call(self, mocker, mock_aws_clients):
         """
-        Test that `validate_s3bucket` propagates exceptions raised by
-        `check_bucket_exists`.
+        Test that `validate_s3bucket` checks the buckets on every call when
+        `FORCE_REVALIDATE_BUCKETS` was set at cold start.
 
         Args:
             mocker: The pytest-mock fixture for mocking dependencies.
             mock_aws_clients: The fixture providing mocked AWS clients.
 
         Asserts:
-            - An exception is raised when `check_bucket_exists` fails.
-            - The exception message matches the expected error.
+            - `check_bucket_exists` is called three times per call.
         """
         # Arrange
         s3_client_mock, _, _ = mock_aws_clients
-
+        mocker.patch("serverless.functions.fhelpers._FORCE_REVALIDATE_BUCKETS", True)
         check_bucket_mock = mocker.patch(
             "serverless.functions.fhelpers.check_bucket_exists"
-        )  # Correct import path
-        check_bucket_mock.side_effect = Exception("Bucket does not exist")
+        )
 
-        # Act & Assert
-        with pytest.raises(Exception) as excinfo:
-            validate_s3bucket(s3_client_mock)
+        # Act
+        validate_s3bucket(s3_client_mock)
+        validate_s3bucket(s3_client_mock)
 
-        assert "Bucket does not exist" in str(excinfo.value)
+        # Assert
+        assert check_bucket_mock.call_count == 6
@@ -13,6 +13,7 @@ Classes:
 
 Constants:
     LOG (logging.Logger): A logger instance for logging messages.
+    BATCH_WRITE_MAX_ITEMS (int): The maximum number of items per BatchWriteItem call.
 
 Example:
     To use the `DynamoDBHelper` class:
@@ -42,6 +43,7 @@ Example:
 """
 
 import logging
+import time
 
 from botocore.exceptions import ClientError
 
@@ -49,6 +51,9 @@ from botocore.exceptions import ClientError
 # use without __name__ as this module will propagate logs to lambda root logger to enable LogCollectorHandler
 LOG = logging.getLogger()
 
+# BatchWriteItem accepts at most 25 put or delete requests per call
+BATCH_WRITE_MAX_ITEMS = 25
+
 
 class DynamoDBHelper:
     """Helper class for interacting with DynamoDB.
@@ -190,6 +195,62 @@ class DynamoDBHelper:
             LOG.error("Failed to write item to DynamoDB: %s", err)
             raise RuntimeError(f"Failed to write item to DynamoDB: {err}") from err
 
+    def write_items(self, item_dicts, max_attempts=5):
+        """Writes several items to the DynamoDB table with `batch_write_item`.
+
+        Items are sent in chunks of `BATCH_WRITE_MAX_ITEMS`, so N items take N / 25 round
+        trips rather than N `put_item` calls. Items returned as `UnprocessedItems` (for
+        example when the table is throttled) are resent with exponential backoff.
+
+        Args:
+            item_dicts (list): The items to be written to the table.
+            max_attempts (int, optional): The number of `batch_write_item` calls allowed per
+                chunk before giving up on its unprocessed items. Defaults to 5.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If any item is missing a required key or has an invalid value.
+            RuntimeError: If a `batch_write_item` call fails or items remain unprocessed
+                after `max_attempts` calls.
+        """
+        # Convert every item up front so an invalid item fails before anything is written
+        put_requests = [
+            {"PutRequest": {"Item": self.convert_pydict_to_dyndb_item(item_dict)}}
+            for item_dict in item_dicts
+        ]
+
+        for start in range(0, len(put_requests), BATCH_WRITE_MAX_ITEMS):
+            request_items = {
+                self.table_name: put_requests[start : start + BATCH_WRITE_MAX_ITEMS]
+            }
+            for attempt in range(max_attempts):
+                if attempt:
+                    time.sleep(min(0.05 * 2**attempt, 1.0))
+                try:
+                    response = self.dyndb_client.batch_write_item(
+                        RequestItems=request_items
+                    )
+                except ClientError as err:
+                    LOG.error("Failed to batch write items to DynamoDB: %s", err)
+                    raise RuntimeError(
+                        f"Failed to batch write items to DynamoDB: {err}"
+                    ) from err
+
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    break
+            else:
+                unprocessed = len(request_items.get(self.table_name, []))
+                LOG.error("%s items left unprocessed by DynamoDB", unprocessed)
+                raise RuntimeError(
+                    f"{unprocessed} items left unprocessed in table {self.table_name} "
+                    f"after {max_attempts} attempts"
+                )
+
+        LOG.info("Successfully wrote %s items to DynamoDB", len(put_requests))
+
     def update_item(self, item_dict):
         """Updates an item in the DynamoDB table.
 
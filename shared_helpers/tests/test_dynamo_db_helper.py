@@ -36,6 +36,9 @@ Test Cases:
 - `test_logging_on_successful_update`: Verifies logging for successful updates.
 - `test_update_item_expression_building`: Ensures `update_item` builds correct expressions and attributes.
 - `test_write_item_overwrites_existing`: Verifies that `write_item` overwrites existing items with the same primary key.
+- `test_write_items_in_chunks`: Ensures `write_items` sends items in `batch_write_item` calls of at most 25.
+- `test_write_items_retries_unprocessed_items`: Verifies that `write_items` resends items returned as unprocessed.
+- `test_write_items_gives_up_after_max_attempts`: Ensures `write_items` raises a `RuntimeError` when items stay unprocessed.
 """
 
 import boto3
@@ -446,3 +449,116 @@ class TestDynamoDBHelper:
         mock_dyndb_client.put_item.assert_called_once_with(
             TableName="example_table", Item=expected_dyndb_item
         )
+
+    # Send items to batch_write_item in chunks of at most 25
+    def test_write_items_in_chunks(self, mocker):
+        """
+        Test that `write_items` sends items in `batch_write_item` calls of at most 25 items.
+
+        Args:
+            mocker: The pytest-mock fixture for mocking dependencies.
+
+        Asserts:
+            - `batch_write_item` is called once per chunk of 25 items.
+            - Every item is sent once, converted to DynamoDB format.
+        """
+        # Arrange
+        mock_dyndb_client = mocker.Mock()
+        mock_dyndb_client.batch_write_item.return_value = {"UnprocessedItems": {}}
+        helper = DynamoDBHelper(
+            mock_dyndb_client, "example_table", ["batch_id", "img_fprint"]
+        )
+        item_dicts = [{"batch_id": 123, "img_fprint": f"hash{i}"} for i in range(60)]
+
+        # Act
+        helper.write_items(item_dicts)
+
+        # Assert
+        calls = mock_dyndb_client.batch_write_item.call_args_list
+        chunks = [c.kwargs["RequestItems"]["example_table"] for c in calls]
+        assert [len(chunk) for chunk in chunks] == [25, 25, 10]
+        assert chunks[0][0] == {
+            "PutRequest": {
+                "Item": {"batch_id": {"N": "123"}, "img_fprint": {"S": "hash0"}}
+            }
+        }
+
+    # Resend items that DynamoDB returns as unprocessed
+    def test_write_items_retries_unprocessed_items(self, mocker):
+        """
+        Test that `write_items` resends the items returned in `UnprocessedItems`.
+
+        Args:
+            mocker: The pytest-mock fixture for mocking dependencies.
+
+        Asserts:
+            - The second `batch_write_item` call sends only the unprocessed items.
+            - The retry waits before resending.
+        """
+        # Arrange
+        mock_sleep = mocker.patch("shared_helpers.dynamo_db_helper.time.sleep")
+        mock_dyndb_client = mocker.Mock()
+        helper = DynamoDBHelper(
+            mock_dyndb_client, "example_table", ["batch_id", "img_fprint"]
+        )
+        item_dicts = [{"batch_id": 123, "img_fprint": f"hash{i}"} for i in range(3)]
+        unprocessed = {
+            "example_table": [
+                {
+                    "PutRequest": {
+                        "Item": helper.convert_pydict_to_dyndb_item(item_dicts[2])
+                    }
+                }
+            ]
+        }
+        mock_dyndb_client.batch_write_item.side_effect = [
+            {"UnprocessedItems": unprocessed},
+            {"UnprocessedItems": {}},
+        ]
+
+        # Act
+        helper.write_items(item_dicts)
+
+        # Assert
+        assert mock_dyndb_client.batch_write_item.call_count == 2
+        mock_dyndb_client.batch_write_item.assert_called_with(RequestItems=unprocessed)
+        mock_sleep.assert_called_once()
+
+    # Raise RuntimeError when items are still unprocessed after max_attempts
+    def test_write_items_gives_up_after_max_attempts(self, mocker):
+        """
+        Test that `write_items` raises a `RuntimeError` when items remain unprocessed
+        after `max_attempts` calls.
+
+        Args:
+            mocker: The pytest-mock fixture for mocking dependencies.
+
+        Asserts:
+            - `batch_write_item` is called `max_attempts` times.
+            - A `RuntimeError` is raised with the expected error message.
+        """
+        # Arrange
+        mocker.patch("shared_helpers.dynamo_db_helper.time.sleep")
+        mock_dyndb_client = mocker.Mock()
+        helper = DynamoDBHelper(
+            mock_dyndb_client, "example_table", ["batch_id", "img_fprint"]
+        )
+        item_dict = {"batch_id": 123, "img_fprint": "abc123"}
+        mock_dyndb_client.batch_write_item.return_value = {
+            "UnprocessedItems": {
+                "example_table": [
+                    {
+                        "PutRequest": {
+                            "Item": helper.convert_pydict_to_dyndb_item(item_dict)
+                        }
+                    }
+                ]
+            }
+        }
+
+        # Act & Assert
+        with pytest.raises(RuntimeError) as excinfo:
+            helper.write_items([item_dict], max_attempts=3)
+
+        assert mock_dyndb_client.batch_write_item.call_count == 3
+        assert "1 items left unprocessed" in str(excinfo.value)